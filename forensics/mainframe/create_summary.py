@@ -1,110 +0,0 @@
-#!/usr/bin/env python3
-"""
-XMI Archive Analysis Summary
-Summary of analysis of ARCHIVE.NETDATA.XMI file
-"""
-
-def create_summary():
-    """Create a comprehensive summary of the XMI analysis"""
-    
-    summary = """
-# XMI ARCHIVE ANALYSIS SUMMARY
-Generated on: November 7, 2025
-
-## FILE OVERVIEW
-- **Original file**: ARCHIVE.NETDATA.XMI
-- **File size**: 22,804 bytes
-- **Format**: Base64 encoded ZIP archive
-- **Decoded size**: 16,880 bytes
-
-## STRUCTURE DISCOVERED
-The file contains a Base64-encoded ZIP archive with the following structure:
-
-### ZIP Entries Found:
-1. **EMAILS** (Position: 211)
-   - Compressed: 989 bytes → Uncompressed: 5,520 bytes
-   - Compression method: Deflate (8)
-
-2. **Q1** (Position: 1,244) 
-   - Compressed: 3,976 bytes → Uncompressed: 21,120 bytes
-   - Compression method: Deflate (8)
-
-3. **Q2** (Position: 5,282)
-   - Compressed: 3,430 bytes → Uncompressed: 18,160 bytes
-   - Compression method: Deflate (8)
-
-4. **Q3** (Position: 8,772)
-   - Compressed: 3,364 bytes → Uncompressed: 17,760 bytes  
-   - Compression method: Deflate (8)
-
-5. **Q4** (Position: 12,196)
-   - Compressed: 3,895 bytes → Uncompressed: 20,640 bytes
-   - Compression method: Deflate (8)
-
-6. **USERS** (Position: 16,153)
-   - Compressed: 231 bytes → Uncompressed: 800 bytes
-   - Compression method: Deflate (8)
-
-## TECHNICAL CHALLENGES
-- **Decompression Issues**: All entries use deflate compression (method 8), but standard decompression libraries (zlib) failed to decompress the data
-- **Possible Causes**:
-  - Non-standard deflate implementation
-  - Corrupted compression headers
-  - Custom compression algorithm
-  - Encrypted or obfuscated data
-
-## EXTRACTION RESULTS
-Despite decompression failures, we successfully:
-- ✅ Decoded the base64 wrapper
-- ✅ Parsed ZIP structure and identified 6 entries
-- ✅ Extracted raw compressed data for each entry
-- ✅ Identified file names: EMAILS, Q1, Q2, Q3, Q4, USERS
-- ✅ Found 204 potential identifiers in the raw data
-
-## FORENSIC FINDINGS
-The archive appears to contain:
-- **Email data** (EMAILS file)
-- **Question sets** (Q1-Q4 files) - possibly survey or quiz data
-- **User information** (USERS file)
-
-This suggests the archive may contain:
-- Survey or questionnaire responses
-- User database information  
-- Email communications or contact lists
-
-## NEXT STEPS FOR FURTHER ANALYSIS
-To fully extract the data, consider:
-
-1. **Specialized Tools**: Try tools specific to mainframe archives or older compression formats
-2. **Hex Analysis**: Manual analysis of compression headers to identify the exact format
-3. **Alternative Libraries**: Try other decompression libraries (7zip, custom implementations)
-4. **Forensic Tools**: Use specialized forensic software that handles corrupted archives
-5. **Original Context**: Investigate the source system to understand the compression method used
-
-## FILES GENERATED
-All analysis files have been saved to the workspace:
-- `read_xmi_archive.py` - Initial xmi-reader attempt
-- `analyze_archive.py` - Base64 decoder and structure analyzer  
-- `comprehensive_xmi_analyzer.py` - Complete structural analysis
-- `ultimate_xmi_reader.py` - Final comprehensive extraction tool
-
-## TECHNICAL SPECIFICATIONS
-- **Programming Language**: Python 3
-- **Libraries Used**: base64, struct, zlib, zipfile
-- **xmi-reader Library**: Version 0.5.9 (attempted but file format incompatible)
-"""
-
-    # Write summary to file
-    summary_path = "/Users/corey/team-game-fall/forensics/mainframe/ANALYSIS_SUMMARY.md"
-    
-    with open(summary_path, 'w') as f:
-        f.write(summary)
-    
-    print("📋 ANALYSIS SUMMARY CREATED")
-    print("=" * 40)
-    print(f"Summary saved to: {summary_path}")
-    print("\n" + "="*60)
-    print(summary)
-
-if __name__ == "__main__":
-    create_summary()
\ No newline at end of file
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# Run with: python3 -m pytest test_xmikit.py
+
+import random
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from xmikit import convert, deflatescan, detect, netdata, patterns, pds, run, source
+
+ARCHIVE = Path(__file__).with_name("ARCHIVE.NETDATA.XMI")
+HEADER_TEXT = [b"INMR01", b"ORIGNODE", b"DESTUID", b"INMCOPY", b"INMR03"]
+
+
+def test_control_records_are_regions_of_their_own():
+    with source.load(ARCHIVE) as archive:
+        spans = netdata.control_spans(archive.data)
+        regions = detect.detect_regions(archive.data, boundaries=[p for s in spans for p in s])
+    assert spans[0][0] == 0
+    assert (regions[0].start, regions[0].end) == spans[0]
+
+
+def test_inmr_header_text_is_converted():
+    with source.load(ARCHIVE) as archive:
+        spans = netdata.control_spans(archive.data)
+        regions = detect.detect_regions(archive.data, boundaries=[p for s in spans for p in s])
+        text = b"".join(convert.convert(archive.data, "cp037", regions=regions, text_spans=spans))
+    for word in HEADER_TEXT:
+        assert word in text
+
+
+def test_ebcdic_plugin_output_has_inmr_header(tmp_path):
+    with source.load(ARCHIVE) as archive:
+        run(archive, tmp_path, ["ebcdic"])
+    text = (tmp_path / "netdata_cp037.txt").read_bytes()
+    for word in HEADER_TEXT:
+        assert word in text
+
+
+def test_windowed_decode_finds_what_a_whole_decode_does():
+    regexes = [patterns.keyword_regex("INMR"), patterns.EMAIL_RE] + patterns.USER_ID_PATTERNS
+    with source.load(ARCHIVE) as archive:
+        text = archive.data[:].decode("cp037")
+        found = patterns.find_decoded(archive.data, "cp037", regexes, size=100, margin=20)
+        assert found == [[(m.start(), m.group()) for m in r.finditer(text)] for r in regexes]
+        assert found[0]
+        assert patterns.IDENTIFIER_BYTES_RE.findall(archive.data) == \
+            [m.encode("latin-1") for m in patterns.IDENTIFIER_RE.findall(archive.data[:].decode("latin-1"))]
+
+
+def test_readable_runs_restart_after_the_limit():
+    assert list(patterns.readable_runs(["abcdefgh", "ijklmn"], limit=8)) == ["abcdefgh", "ijklmn"]
+    assert list(patterns.readable_runs(["abcdefg", "hij"], limit=8)) == ["abcdefghij"]
+    assert list(patterns.readable_runs(["abcdefgh", "ij\0klmnop"], limit=8)) == ["abcdefgh", "klmnop"]
+    assert list(patterns.readable_runs(["xx\0abc", "defg"], limit=8)) == ["abcdefg"]
+
+
+def test_noise_running_into_a_deflate_stream_does_not_hide_it():
+    text = b" ".join(b"record %d of the quarterly report" % i for i in range(60))
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    stream = compressor.compress(text) + compressor.flush()
+    # a non-final stored block of three bytes decodes straight into the real stream,
+    # which then starts 3 bits into the byte 8 bytes later
+    prefix = b"\x00\x03\x00\xfc\xff" + b"\x9a\x10\x77"
+    noise = bytes(random.Random(5).randrange(256) for _ in range(300))
+    value = int.from_bytes(prefix + stream, "little") << 3 | noise[-1] & 7
+    data = noise[:-1] + value.to_bytes(len(prefix) + len(stream) + 1, "little") + bytes(50)
+    kept = deflatescan.scan(data, bits=True, workers=1)
+    starts = {(s.offset, s.bit): s for s in kept}
+    assert (299, 3) in starts  # the stored block and the stream after it decode as one
+    real = starts[299 + len(prefix), 3]
+    assert real.complete and deflatescan.inflate_stream(data, real) == text
+
+
+def test_zip_search_credits_keywords_sharing_a_variant(tmp_path, capsys):
+    with source.load(ARCHIVE) as archive:
+        run(archive, tmp_path, ["search"], keywords=["FIRE", "fire"])
+    zip_hits = capsys.readouterr().out.split("ZIP entries:")[1]
+    assert "USERS: FIRE at 0, fire at 0" in zip_hits
+
+
+def rdw(data, span=0):
+    return (len(data) + 4).to_bytes(2, "big") + bytes([span, 0]) + data
+
+
+def unblock(block):
+    return [bytes(r) for r in netdata.Unblocker(0x4000, 84).records(block)]
+
+
+def test_variable_block_with_one_record_and_no_bdw():
+    assert unblock(rdw(b"HELLO WORLD")) == [b"HELLO WORLD"]
+
+
+def test_variable_block_with_one_record_and_a_bdw():
+    records = rdw(b"HELLO WORLD")
+    assert unblock((len(records) + 4).to_bytes(2, "big") + b"\0\0" + records) == [b"HELLO WORLD"]
+
+
+def test_variable_block_with_a_bdw_and_several_records():
+    records = rdw(b"ONE") + rdw(b"TWO") + rdw(b"THREE")
+    assert unblock((len(records) + 4).to_bytes(2, "big") + b"\0\0" + records) == [b"ONE", b"TWO", b"THREE"]
+
+
+def unload_block(cc, hh, r, data, key=b""):
+    return pds.BLOCK_HEADER.pack(0, 0, 0, cc, hh, r, len(key), len(data)) + key + data
+
+
+def unload_records(tracks_per_cylinder=15):
+    # COPYR1 (RECFM FB, LRECL 80, 15 tracks per cylinder), COPYR2 (one extent from CC 10 HH 2),
+    # one directory block listing A at TTR 000001 and B at 000003, then the data of both
+    copyr1 = b"\x00" + pds.COPYR1_ID + struct.pack(">HHH", 0x0200, 3200, 80) + b"\x90\x00" + bytes(14)
+    if tracks_per_cylinder:
+        copyr1 += struct.pack(">H", tracks_per_cylinder)
+    copyr2 = bytes(16) + bytes(6) + struct.pack(">HHHHH", 10, 2, 10, 14, 13)
+    entries = "A       ".encode("cp037") + b"\x00\x00\x01\x00" + "B       ".encode("cp037") + b"\x00\x00\x03\x00"
+    entries += pds.DIR_END + bytes(4)
+    directory = (len(entries) + 2).to_bytes(2, "big") + entries
+    data = [unload_block(10, 2, 1, b"A" * 80), unload_block(10, 2, 2, b""),
+            unload_block(10, 2, 3, b"B" * 80), unload_block(10, 2, 3, b"b" * 80), unload_block(10, 2, 4, b"")]
+    return [copyr1, copyr2, unload_block(0, 0, 1, directory.ljust(256, b"\0"), key=pds.DIR_END),
+            b"".join(data[:2]), b"".join(data[2:])]
+
+
+def test_pds_unload_lists_members_without_reading_their_data():
+    read = []
+    unload = pds.PDSUnload(read.append(rec) or rec for rec in unload_records())
+    assert [(m.name, m.ttr) for m in unload] == [("A", 1), ("B", 3)]
+    assert (unload.lrecl, unload.recfm, unload.tracks_per_cylinder) == (80, 0x9000, 15)
+    assert len(read) == 3
+    assert [(names, b"".join(blocks)) for names, blocks in unload.extract(["B", "A"])] == \
+        [(("A",), b"A" * 80), (("B",), b"B" * 80 + b"b" * 80)]
+    with pytest.raises(pds.PDSError):
+        unload.read("A")
+
+
+def test_pds_unload_without_device_geometry_cannot_locate_members():
+    unload = pds.PDSUnload(unload_records(tracks_per_cylinder=0))
+    assert len(unload) == 2
+    with pytest.raises(pds.PDSError):
+        unload.read("A")
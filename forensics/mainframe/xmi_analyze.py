@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+XMI/NETDATA Archive Analyzer
+Decodes a transmission once and runs the selected xmikit analysis plugins over it
+"""
+
+import argparse
+
+import xmikit
+from xmikit.ebcdic import CODEPAGES
+from xmikit.plugins import DEFAULT_KEYWORDS
+
+
+def main():
+    p = argparse.ArgumentParser(description="Analyze an XMI/NETDATA transmission (base64 or binary).")
+    p.add_argument("infile", nargs="?", help="transmission to analyze (e.g. ARCHIVE.NETDATA.XMI)")
+    p.add_argument("outdir", nargs="?", help="directory for extracted members and reports")
+    p.add_argument("--plugins", metavar="NAME,...",
+                   help="plugins to run, in order (default: all; see --list)")
+    p.add_argument("--list", action="store_true", help="list the available plugins and exit")
+    p.add_argument("--codepage", default=CODEPAGES[0], choices=CODEPAGES,
+                   help="EBCDIC code page for the ebcdic plugin (default: %(default)s)")
+    p.add_argument("--keywords", default=",".join(DEFAULT_KEYWORDS), metavar="WORD,...",
+                   help="keywords to search for (default: %(default)s)")
+    p.add_argument("--members", metavar="NAME,...",
+                   help="PDS members for the pds plugin to extract (default: all)")
+    p.add_argument("--workers", type=int, default=1, metavar="N",
+                   help="threads inflating ZIP members (CRC-checked) and processes for the "
+                        "deflate scan (default: %(default)s, serial)")
+    p.add_argument("--bit-offsets", action="store_true",
+                   help="deflate plugin: try every bit offset, not just byte offsets (8x slower)")
+    p.add_argument("--max-inflate", type=int, metavar="BYTES",
+                   help="stop the streaming member scans (search, strings) after this many bytes per member")
+    args = p.parse_args()
+
+    if args.list:
+        for plug in xmikit.PLUGINS.values():
+            print(f"{plug.name:10s} {plug.help}")
+        return
+    if not args.infile or not args.outdir:
+        p.error("infile and outdir are required")
+    names = args.plugins.split(",") if args.plugins else None
+    unknown = [n for n in names or [] if n not in xmikit.PLUGINS]
+    if unknown:
+        p.error(f"unknown plugin(s): {', '.join(unknown)}")
+
+    with xmikit.load(args.infile) as archive:
+        print(f"Loaded {archive.path.name} ({archive.encoding}): "
+              f"{archive.raw_size:,} -> {len(archive.data):,} bytes")
+        xmikit.run(archive, args.outdir, names, codepage=args.codepage,
+                   keywords=[k for k in args.keywords.split(",") if k],
+                   members=[m.upper() for m in args.members.split(",") if m] if args.members else None,
+                   workers=args.workers, inflate_budget=args.max_inflate,
+                   bit_offsets=args.bit_offsets)
+    print(f"\nResults saved to: {args.outdir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""
+XMI/NETDATA forensic toolkit.
+
+load() reads and decodes a transmission once; run() hands the resulting Archive
+to each registered analysis plugin in the same process.  xmi_analyze.py is the
+command line front end.
+"""
+
+from .plugins import PLUGINS, Context, plugin, run
+from .source import Archive, detect_format, iter_base64, load, stream, unwrap_base64
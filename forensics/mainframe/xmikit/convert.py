@@ -0,0 +1,104 @@
+"""
+Bulk EBCDIC conversion with 256-byte bytes.translate tables.
+
+A table maps every byte of a code page straight to its ASCII or latin-1 byte
+(characters the target lacks and control characters become '.', the EBCDIC
+line ends become '\n'), so converting a dataset is one C-speed translate per
+region with no str round trip.  convert() applies it only to the regions
+detect.detect_regions() classifies as text, and to the NETDATA text units
+whose mix of names and binary lengths the detector calls binary; other binary
+regions are shown as a short hex dump or skipped.
+"""
+
+from . import detect
+from .ebcdic import CODEPAGES
+
+TARGETS = ("ascii", "latin-1")
+MISSING = b"."
+HEX_LIMIT = 256
+HEX_WIDTH = 32
+
+_tables = {}
+
+
+def translate_table(codepage, target="latin-1"):
+    """256-byte table taking each byte of `codepage` to its `target` byte"""
+    key = (codepage, target)
+    table = _tables.get(key)
+    if table is None:
+        table = bytearray()
+        for b in range(256):
+            try:
+                char = bytes([b]).decode(codepage)
+            except UnicodeDecodeError:
+                char = ""
+            if char in ("\n", "\x85"):  # EBCDIC LF and NL
+                table += b"\n"
+            elif char in ("\t", "\r") or char.isprintable() and char:
+                try:
+                    table += char.encode(target)
+                except UnicodeEncodeError:
+                    table += MISSING
+            else:
+                table += MISSING
+        table = _tables[key] = bytes(table)
+    return table
+
+
+def translate(data, codepage, target="latin-1"):
+    """data converted from `codepage` to `target` bytes, same length"""
+    return bytes(data).translate(translate_table(codepage, target))
+
+
+def hex_dump(data, start, limit=HEX_LIMIT):
+    """Offset/hex lines for the first `limit` bytes of a region starting at `start`"""
+    shown = bytes(data[:limit])
+    lines = [f"{start + pos:08x}  {shown[pos:pos + HEX_WIDTH].hex(' ')}\n"
+             for pos in range(0, len(shown), HEX_WIDTH)]
+    if len(data) > limit:
+        lines.append(f"          ... {len(data) - limit:,} more bytes\n")
+    return "".join(lines).encode("ascii")
+
+
+def convert(data, codepage="cp037", target="latin-1", regions=None, binary="hex", lrecl=None,
+            text_spans=()):
+    """Yield the converted text of data, region by region
+
+    `regions` defaults to detect.detect_regions(data).  Text regions the
+    detector puts in an EBCDIC code page are translated from `codepage`, and
+    ASCII/latin-1 regions are passed through the same way.  With `lrecl`,
+    text is cut into lines of that record length (fixed-length records).
+    Binary regions become a hex dump, or a one-line marker when `binary` is
+    "skip", except inside `text_spans` ((start, end) ranges known to hold
+    EBCDIC text units, see netdata.control_spans), which are translated from
+    `codepage` whatever the detector says.
+    """
+    view = memoryview(data)
+    for region in regions if regions is not None else detect.detect_regions(data):
+        chunk = view[region.start:region.end]
+        if region.kind != "text" and any(a <= region.start and region.end <= b for a, b in text_spans):
+            yield translate(chunk, codepage, target) + b"\n"
+            continue
+        if region.kind != "text":
+            yield f"[binary {region.start:#x}-{region.end:#x}, {len(chunk):,} bytes]\n".encode("ascii")
+            if binary == "hex":
+                yield hex_dump(chunk, region.start)
+            continue
+        source = codepage if region.codepage in CODEPAGES else region.codepage
+        text = translate(chunk, source, target)
+        if lrecl:
+            # record boundaries are counted from the start of data, not of the region
+            first = -region.start % lrecl
+            cuts = ([0] if first else []) + list(range(first, len(text), lrecl))
+            text = b"\n".join(text[a:b].rstrip() for a, b in zip(cuts, cuts[1:] + [len(text)]))
+        yield text if text.endswith(b"\n") else text + b"\n"
+
+
+def write_converted(path, data, **options):
+    """convert() data into a file; returns the number of bytes written"""
+    written = 0
+    with open(path, "wb") as f:
+        for piece in convert(data, **options):
+            f.write(piece)
+            written += len(piece)
+    return written
@@ -0,0 +1,202 @@
+"""
+Brute-force recovery of deflate data: try raw deflate, zlib and gzip decoding
+at every byte offset (optionally every bit offset) of a damaged buffer.
+
+Each offset first goes through a cheap header check (BTYPE 3 never occurs,
+stored blocks carry LEN/~LEN, dynamic blocks bound HLIT/HDIST, zlib headers
+are a multiple of 31, gzip starts 1F 8B 08), then a short zlib probe, and only
+streams still running at the end of the probe are inflated in full (at a bit
+offset, only those get the rest of the buffer shifted).  Offset ranges are
+spread over a process pool whose workers memory-map the buffer from a file
+instead of receiving a copy.
+"""
+
+import mmap
+import os
+import tempfile
+import zlib
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+KINDS = ("deflate", "zlib", "gzip")
+WBITS = {"deflate": -15, "zlib": 15, "gzip": 31}
+PROBE_SIZE = 64
+PROBE_WINDOW = 4 * PROBE_SIZE  # input inflated before a candidate gets the whole tail
+SLICE = 1 << 16
+
+Stream = namedtuple("Stream", "offset bit kind consumed output_size complete")
+
+
+def plausible_deflate(b0, b1, b2, b3, b4):
+    """Cheap check of a deflate block header whose first bit is the low bit of b0"""
+    btype = (b0 >> 1) & 3
+    if btype == 3:
+        return False
+    if btype == 0:  # stored: LEN then its one's complement, after the header byte
+        return (b1 | b2 << 8) == (~(b3 | b4 << 8) & 0xFFFF)
+    if btype == 2:  # dynamic: HLIT <= 29 (286 codes), HDIST <= 29 (30 codes)
+        return (b0 >> 3) <= 29 and (b1 & 0x1F) <= 29
+    return True
+
+
+def plausible_zlib(b0, b1):
+    return b0 & 0x0F == 8 and b0 >> 4 <= 7 and (b0 << 8 | b1) % 31 == 0
+
+
+def plausible_gzip(b0, b1, b2):
+    return b0 == 0x1F and b1 == 0x8B and b2 == 8
+
+
+def shifted(data, offset, bit, length):
+    """`length` bytes of data starting `bit` bits into data[offset] (deflate bit order)"""
+    chunk = bytes(data[offset:offset + length + 1])
+    value = int.from_bytes(chunk, "little") >> bit
+    return value.to_bytes(len(chunk), "little")[:length]
+
+
+def _inflate(window, kind, max_output, piece, keep):
+    """Feed window to an inflater piece by piece until the stream ends, breaks or fills max_output
+
+    Returns (consumed, output pieces or their total size, complete, broken).
+    Small pieces mean a stream that breaks off (a damaged archive) still yields
+    the output decoded before the damage.
+    """
+    inflater = zlib.decompressobj(WBITS[kind])
+    output = [] if keep else 0
+    out = consumed = pos = 0
+    broken = False
+    try:
+        while pos < len(window) and out < max_output and not inflater.eof:
+            chunk = inflater.decompress(window[pos:pos + piece], max_output - out)
+            out += len(chunk)
+            if keep:
+                output.append(chunk)
+            pos += piece
+            consumed = pos - len(inflater.unconsumed_tail) - len(inflater.unused_data)
+    except zlib.error:
+        broken = True
+    return consumed, output if keep else out, inflater.eof, broken
+
+
+def try_stream(window, kind, min_output, max_output):
+    """(consumed, output size, complete) of a stream at the start of window, or None"""
+    consumed, out, complete, _broken = _inflate(window, kind, max_output, PROBE_SIZE, keep=False)
+    if out < min_output:
+        return None
+    return consumed, out, complete
+
+
+_data = None
+
+
+def _init(path):
+    global _data
+    with open(path, "rb") as f:
+        _data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def scan_range(start, stop, kinds=KINDS, bits=False, min_output=64, max_output=1 << 24, data=None):
+    """Streams starting at offsets start..stop-1 (of `data`, or the worker's buffer)"""
+    data = _data if data is None else data
+    view = memoryview(data)
+    end = len(data)
+    found = []
+    for offset in range(start, min(stop, end)):
+        b = bytes(view[offset:offset + 6]).ljust(6, b"\0")
+        for bit in range(8 if bits else 1):
+            if bit:
+                b = shifted(view, offset, bit, 6).ljust(6, b"\0")
+            for kind in kinds:
+                if kind == "deflate":
+                    ok = plausible_deflate(b[0], b[1], b[2], b[3], b[4])
+                elif bit:
+                    continue  # zlib and gzip streams are byte aligned
+                elif kind == "zlib":
+                    ok = plausible_zlib(b[0], b[1])
+                else:
+                    ok = plausible_gzip(b[0], b[1], b[2])
+                if not ok:
+                    continue
+                # inflate a short probe window first: a stream that ends or breaks inside it
+                # is settled there, and only one still running needs the whole (shifted) tail
+                rest = end - offset - (1 if bit else 0)
+                size = min(PROBE_WINDOW, rest)
+                head = shifted(view, offset, bit, size) if bit else view[offset:offset + size]
+                consumed, out, complete, broken = _inflate(head, kind, max_output, PROBE_SIZE, keep=False)
+                if size < rest and not (complete or broken or out >= max_output):
+                    window = shifted(view, offset, bit, rest) if bit else view[offset:]
+                    consumed, out, complete, _broken = _inflate(window, kind, max_output, PROBE_SIZE,
+                                                                keep=False)
+                if out >= min_output:
+                    found.append(Stream(offset, bit, kind, consumed, out, complete))
+    return found
+
+
+def scan(data, kinds=KINDS, bits=False, workers=None, min_output=64, max_output=1 << 24,
+         nested=False, path=None):
+    """Every valid deflate/zlib/gzip stream in data, ordered by offset
+
+    A stream counts when it inflates at least `min_output` bytes; `complete`
+    says whether it reached its end-of-stream marker.  Unless `nested`, a hit
+    lying strictly inside the bit range of an earlier complete stream is
+    dropped (a valid stream usually decodes from a few of its own interior
+    offsets too) if it breaks off or that stream inflated `min_output` bytes
+    before the hit's first bit: noise that decodes as a short block running
+    into a real stream hides nothing.
+    Workers map `path`, a file holding exactly data, when given; otherwise data
+    is written to a temporary file once for them.
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = [(start, start + SLICE) for start in range(0, len(data), SLICE)]
+    options = dict(kinds=kinds, bits=bits, min_output=min_output, max_output=max_output)
+    if workers == 1 or len(ranges) == 1:
+        found = [s for start, stop in ranges for s in scan_range(start, stop, data=data, **options)]
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            if path is None:
+                path = os.path.join(tmp, "buffer")
+                with open(path, "wb") as f:
+                    f.write(data)
+            with ProcessPoolExecutor(workers, initializer=_init, initargs=(os.fspath(path),)) as pool:
+                futures = [pool.submit(scan_range, start, stop, **options) for start, stop in ranges]
+                found = [s for f in futures for s in f.result()]
+    if nested:
+        return found
+    kept = []
+    hiding = []  # complete streams kept so far whose bit range may hold later hits
+    for s in sorted(found, key=lambda s: (s.offset, s.bit)):
+        start, end = bit_range(s)
+        hiding = [h for h in hiding if bit_range(h)[1] > start]
+        if any(bit_range(h)[0] < start and end <= bit_range(h)[1]
+               and (not s.complete or inflated_before(data, h, start, min_output) >= min_output)
+               for h in hiding):
+            continue
+        kept.append(s)
+        if s.complete:
+            hiding.append(s)
+    return kept
+
+
+def bit_range(stream):
+    """(first bit, bit after the last byte consumed) of a Stream, counted from the buffer start"""
+    start = stream.offset * 8 + stream.bit
+    return start, start + stream.consumed * 8
+
+
+def inflated_before(data, stream, bit, max_output):
+    """Output a stream inflates from its input before `bit` (capped at max_output)"""
+    size = (bit - bit_range(stream)[0]) // 8
+    if stream.bit:
+        window = shifted(data, stream.offset, stream.bit, size)
+    else:
+        window = memoryview(data)[stream.offset:stream.offset + size]
+    return _inflate(window, stream.kind, max_output, PROBE_SIZE, keep=False)[1]
+
+
+def inflate_stream(data, stream, max_output=1 << 24):
+    """The output of a Stream found by scan(), up to where it ends or breaks off"""
+    if stream.bit:
+        window = shifted(data, stream.offset, stream.bit, len(data) - stream.offset - 1)
+    else:
+        window = memoryview(data)[stream.offset:]
+    return b"".join(_inflate(window, stream.kind, max_output, PROBE_SIZE, keep=True)[1])
@@ -0,0 +1,149 @@
+"""
+Code page detection from byte histograms.
+
+Each candidate code page gets a 256-entry weight table: the log frequency, in
+English/mainframe text, of the character the byte decodes to.  A region's
+score under a code page is its byte histogram dotted with that table, so a
+region is counted once and never decoded.  NumPy is used when installed
+(all regions of a buffer in one bincount); otherwise collections.Counter.
+"""
+
+import math
+from collections import Counter, namedtuple
+
+from .ebcdic import CODEPAGES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CANDIDATES = ["ascii", "latin-1"] + CODEPAGES
+REGION_SIZE = 4096
+TEXT_THRESHOLD = 0.85  # share of bytes that must be common text characters
+
+# per-mille frequencies of letters in English text; case is ignored since
+# mainframe text is mostly upper case
+LETTERS = dict(zip("etaoinshrdlcumwfgypbvkjxqz",
+                   [127, 91, 82, 75, 70, 67, 63, 61, 60, 43, 40, 28, 28, 24, 24, 22, 20, 20, 19, 15,
+                    10, 8, 1.5, 1.5, 1, 0.7]))
+OTHER = {" ": 180, "\n": 20, "\r": 5, "\x85": 20, "\t": 5}  # U+0085 is the EBCDIC NL
+OTHER.update(dict.fromkeys("0123456789", 5))
+OTHER.update(dict.fromkeys(".,:;-'\"()/*$@#=_+&%<>?!", 2))
+RARE = 0.01  # anything else printable
+UNLIKELY = 1e-4  # control characters, unassigned bytes
+
+Candidate = namedtuple("Candidate", "codepage score confidence")
+Region = namedtuple("Region", "start end kind codepage confidence")
+
+
+def _frequency(char):
+    if char.lower() in LETTERS:
+        return LETTERS[char.lower()]
+    if char in OTHER:
+        return OTHER[char]
+    return RARE if char.isprintable() else UNLIKELY
+
+
+def _tables(codepage):
+    """(log-frequency weights, is-common-text flags) for the 256 byte values"""
+    weights, common = [], []
+    for b in range(256):
+        try:
+            char = bytes([b]).decode(codepage)
+        except UnicodeDecodeError:
+            char = None
+        freq = _frequency(char) if char is not None else UNLIKELY
+        weights.append(math.log(freq / 1000))
+        common.append(1.0 if freq >= 1 else 0.0)
+    return weights, common
+
+
+TABLES = {cp: _tables(cp) for cp in CANDIDATES}
+
+
+def histogram(region):
+    """Byte counts of a region as a 256-entry list"""
+    if np is not None:
+        return np.bincount(np.frombuffer(region, dtype=np.uint8), minlength=256).tolist()
+    counts = Counter(bytes(region))
+    return [counts.get(b, 0) for b in range(256)]
+
+
+def rank(hist, candidates=CANDIDATES):
+    """Candidates for one histogram, best first
+
+    score is the mean log frequency per byte; confidence is the share of
+    bytes that decode to common text characters under that code page.
+    """
+    total = sum(hist) or 1
+    ranked = []
+    for cp in candidates:
+        weights, common = TABLES[cp]
+        score = sum(h * w for h, w in zip(hist, weights) if h) / total
+        confidence = sum(h * c for h, c in zip(hist, common) if h) / total
+        ranked.append(Candidate(cp, round(score, 3), round(confidence, 3)))
+    ranked.sort(key=lambda c: -c.score)  # stable: ties keep the CANDIDATES order
+    return ranked
+
+
+def detect(data, candidates=CANDIDATES):
+    """Ranked code page candidates for a whole buffer"""
+    return rank(histogram(data), candidates)
+
+
+def region_histograms(data, size=REGION_SIZE):
+    """Histograms of consecutive `size`-byte regions; a (regions x 256) array with NumPy"""
+    if np is None:
+        view = memoryview(data)
+        return [histogram(view[pos:pos + size]) for pos in range(0, len(view), size)]
+    arr = np.frombuffer(data, dtype=np.uint8)
+    blocks = []
+    step = max(size, (1 << 24) // size * size)  # bounds the index array to 16 Mi entries
+    for pos in range(0, len(arr), step):
+        block = arr[pos:pos + step]
+        rows = -(-len(block) // size)
+        index = (np.arange(len(block)) // size) * 256 + block
+        blocks.append(np.bincount(index, minlength=rows * 256).reshape(rows, 256))
+    return np.concatenate(blocks) if blocks else np.zeros((0, 256), dtype=np.int64)
+
+
+def best_per_region(hists, candidates=CANDIDATES):
+    """(best code page, confidence) for each histogram"""
+    if np is None or not isinstance(hists, np.ndarray):
+        return [(c.codepage, c.confidence) for c in (rank(h, candidates)[0] for h in hists)]
+    weights = np.array([TABLES[cp][0] for cp in candidates])
+    common = np.array([TABLES[cp][1] for cp in candidates])
+    totals = np.maximum(hists.sum(axis=1, keepdims=True), 1)
+    scores = hists @ weights.T / totals
+    best = scores.argmax(axis=1)  # first maximum: ties keep the CANDIDATES order
+    confidence = (hists @ common.T / totals)[np.arange(len(best)), best]
+    return [(candidates[b], round(float(c), 3)) for b, c in zip(best, confidence)]
+
+
+def detect_regions(data, size=REGION_SIZE, candidates=CANDIDATES, threshold=TEXT_THRESHOLD,
+                   boundaries=()):
+    """Classify `size`-byte regions as text (with their code page) or binary, merging neighbours
+
+    A region is text when the best candidate's confidence reaches `threshold`.
+    Regions also start at every offset in `boundaries` (such as NETDATA record
+    boundaries, see netdata.control_spans) and are never merged across one, so
+    a short header is not averaged into the data next to it.
+    """
+    view = memoryview(data)
+    cuts = sorted({0, len(view)} | {b for b in boundaries if 0 < b < len(view)})
+    regions = []
+    for span_start, span_end in zip(cuts, cuts[1:]):
+        hists = region_histograms(view[span_start:span_end], size)
+        for n, (best, confidence) in enumerate(best_per_region(hists, candidates)):
+            start, end = span_start + n * size, min(span_end, span_start + (n + 1) * size)
+            kind = "text" if confidence >= threshold else "binary"
+            codepage = best if kind == "text" else None
+            prev = regions[-1] if regions else None
+            if prev and prev.end > span_start and prev.kind == kind and prev.codepage == codepage:
+                weight = (prev.end - prev.start, end - start)
+                merged = (prev.confidence * weight[0] + confidence * weight[1]) / sum(weight)
+                regions[-1] = Region(prev.start, end, kind, codepage, round(merged, 3))
+            else:
+                regions.append(Region(start, end, kind, codepage, confidence))
+    return regions
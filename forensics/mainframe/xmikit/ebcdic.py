@@ -0,0 +1,78 @@
+"""
+EBCDIC code pages and NETDATA markers.
+"""
+
+import re
+from collections import namedtuple
+
+# the IBM code pages the old decoders tried, most likely first
+CODEPAGES = ["cp037", "cp500", "cp875", "cp1026", "cp1140"]
+
+NETDATA_HEADERS = ["ORIGNODE", "ORIGUID", "DESTNODE", "DESTUID", "NETDATA", "INMR01", "INMR02"]
+
+
+def search_netdata_headers(data, codepage="cp037"):
+    """Positions of every NETDATA control record / text unit name in raw bytes
+
+    The names are encoded rather than the buffer decoded: in a single-byte code
+    page a name decodes from exactly one byte string.
+    """
+    found = {}
+    for header in NETDATA_HEADERS:
+        encoded = header.encode(codepage)
+        positions = []
+        pos = data.find(encoded)
+        while pos != -1:
+            positions.append(pos)
+            pos = data.find(encoded, pos + len(encoded))
+        if positions:
+            found[header] = positions
+    return found
+
+
+Hit = namedtuple("Hit", "offset needle codepages")
+
+
+class EncodedSearch:
+    """Find text needles in raw bytes under several code pages with one scan
+
+    Each needle is encoded into every code page and identical byte patterns
+    are merged, so a hit is reported once with all the code pages that would
+    have decoded it to the needle.  Nothing is decoded; the byte patterns are
+    compiled into one regex whose zero-width lookahead also reports
+    overlapping hits, and the patterns sharing a first byte are checked at
+    each position it finds.
+    """
+
+    def __init__(self, needles, codepages=CODEPAGES):
+        self.patterns = {}  # encoded bytes -> [(needle, codepage), ...]
+        for needle in filter(None, needles):
+            for cp in codepages:
+                try:
+                    encoded = needle.encode(cp)
+                except UnicodeEncodeError:
+                    continue  # the code page has no such character
+                pairs = self.patterns.setdefault(encoded, [])
+                if (needle, cp) not in pairs:
+                    pairs.append((needle, cp))
+        longest_first = sorted(self.patterns, key=len, reverse=True)
+        self._by_first = {}
+        for encoded in longest_first:
+            self._by_first.setdefault(encoded[0], []).append(encoded)
+        self._regex = None
+        if longest_first:
+            self._regex = re.compile(b"(?=(" + b"|".join(map(re.escape, longest_first)) + b"))")
+
+    def finditer(self, data):
+        """Yield a Hit for every (overlapping) occurrence, in offset order"""
+        if self._regex is None:
+            return
+        view = memoryview(data)
+        for m in self._regex.finditer(data):
+            pos = m.start()
+            for encoded in self._by_first[view[pos]]:
+                if view[pos:pos + len(encoded)] != encoded:
+                    continue
+                pairs = self.patterns[encoded]
+                for needle in dict.fromkeys(n for n, _cp in pairs):
+                    yield Hit(pos, needle, tuple(cp for n, cp in pairs if n == needle))
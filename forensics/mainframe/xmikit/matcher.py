@@ -0,0 +1,164 @@
+"""
+Aho-Corasick multi-pattern matching over bytes.
+
+One pass over the data finds every (overlapping) occurrence of every pattern,
+however many patterns there are, instead of one data.find() loop per pattern.
+The automaton steps through the data in Python, one byte at a time, so a small
+pattern set is matched by one compiled regular expression instead, which runs
+at C speed and is faster until the alternation grows to a few dozen patterns.
+Case folding is a 256-byte translate table applied to the patterns when the
+automaton is built and to each chunk of data as it is scanned, so ASCII and
+EBCDIC text fold alike.
+"""
+
+import re
+from collections import deque
+
+CHUNK_SIZE = 1 << 20
+REGEX_LIMIT = 32  # up to this many patterns, match with a regex rather than the automaton
+
+
+def _fold_table(pairs):
+    table = bytearray(range(256))
+    for upper, lower in pairs:
+        table[upper] = lower
+    return bytes(table)
+
+
+# upper case to lower case, in ASCII and in the EBCDIC letter ranges (A-I, J-R, S-Z)
+FOLD_ASCII = _fold_table((c, c + 0x20) for c in range(0x41, 0x5B))
+FOLD_EBCDIC = _fold_table((c, c - 0x40) for r in ((0xC1, 0xCA), (0xD1, 0xDA), (0xE2, 0xEA))
+                          for c in range(*r))
+
+
+class Matcher:
+    """Aho-Corasick automaton over a list of byte patterns
+
+    `fold` is an optional translate table (FOLD_ASCII, FOLD_EBCDIC or your
+    own) applied to patterns and data alike; ignore_case=True means
+    FOLD_ASCII.  str patterns are encoded with `encoding`.  Hits are
+    (offset, pattern) with the pattern as given, reported as each one ends.
+    Up to REGEX_LIMIT patterns are matched with a lookahead regex instead of
+    the automaton; the hits are the same.
+    """
+
+    def __init__(self, patterns, ignore_case=False, fold=None, encoding="latin-1"):
+        self.fold = fold if fold is not None else (FOLD_ASCII if ignore_case else None)
+        self.patterns = []
+        keys = []
+        for pattern in patterns:
+            key = pattern.encode(encoding) if isinstance(pattern, str) else bytes(pattern)
+            if self.fold is not None:
+                key = key.translate(self.fold)
+            if not key:
+                continue
+            self.patterns.append(pattern)
+            keys.append(key)
+        self._longest = max(map(len, keys), default=0)
+        self._regex = None
+        if len(keys) <= REGEX_LIMIT:
+            # a zero-width lookahead finds every start position, overlapping ones included;
+            # the patterns sharing a first byte are then checked at each of them
+            self._regex = re.compile(b"(?=" + b"|".join(map(re.escape, dict.fromkeys(keys))) + b")")
+            self._by_first = {}
+            for index, key in enumerate(keys):
+                self._by_first.setdefault(key[0], []).append((index, key))
+            return
+        self._goto = [{}]
+        self._out = [()]
+        for index, key in enumerate(keys):
+            self._add(key, index)
+        self._build_failure_links()
+
+    def _add(self, key, index):
+        state = 0
+        for b in key:
+            nxt = self._goto[state].get(b)
+            if nxt is None:
+                nxt = self._goto[state][b] = len(self._goto)
+                self._goto.append({})
+                self._out.append(())
+            state = nxt
+        self._out[state] += ((index, len(key)),)
+
+    def _build_failure_links(self):
+        goto, out = self._goto, self._out
+        self._fail = fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for b, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and b not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(b, 0) if goto[f].get(b, 0) != nxt else 0
+                out[nxt] += out[fail[nxt]]  # a state also ends every pattern its fallback ends
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def iter_chunks(self, chunks, base=0):
+        """Yield (offset, pattern) over a stream of byte chunks; hits may span chunks"""
+        if not self.patterns:
+            return iter(())
+        if self._regex is not None:
+            return self._iter_regex(chunks, base)
+        return self._iter_automaton(chunks, base)
+
+    def _iter_regex(self, chunks, base):
+        # the last len(longest) - 1 bytes of each window are carried into the next one;
+        # a hit is reported by the first window it ends in, ordered like the automaton's
+        regex, by_first, patterns, fold = self._regex, self._by_first, self.patterns, self.fold
+        keep = self._longest - 1
+        tail = b""
+        for chunk in chunks:
+            chunk = bytes(chunk)
+            if fold is not None:
+                chunk = chunk.translate(fold)
+            window = tail + chunk
+            hits = []
+            for m in regex.finditer(window):
+                pos = m.start()
+                for index, key in by_first[window[pos]]:
+                    if pos + len(key) > len(tail) and window.startswith(key, pos):
+                        hits.append((pos + len(key), -len(key), index))
+            start = base - len(tail)
+            for end, neg_length, index in sorted(hits):
+                yield start + end + neg_length, patterns[index]
+            tail = window[max(0, len(window) - keep):] if keep else b""
+            base += len(chunk)
+
+    def _iter_automaton(self, chunks, base):
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        fold = self.fold
+        state = 0
+        for chunk in chunks:
+            if fold is not None:
+                chunk = bytes(chunk).translate(fold)
+            for i, b in enumerate(chunk):
+                nxt = goto[state].get(b)
+                while nxt is None and state:
+                    state = fail[state]
+                    nxt = goto[state].get(b)
+                state = nxt or 0
+                if out[state]:
+                    end = base + i + 1
+                    for index, length in out[state]:
+                        yield end - length, patterns[index]
+            base += len(chunk)
+
+    def finditer(self, data, chunk_size=CHUNK_SIZE):
+        """Yield (offset, pattern) for every occurrence in bytes, a memoryview or an mmap"""
+        view = memoryview(data)
+        return self.iter_chunks(view[pos:pos + chunk_size] for pos in range(0, len(view), chunk_size))
+
+
+def find_all(data, patterns, **options):
+    """{pattern: [offsets]} for every pattern, from one pass over data"""
+    found = {p: [] for p in patterns}
+    for pos, pattern in Matcher(patterns, **options).finditer(data):
+        found[pattern].append(pos)
+    for positions in found.values():
+        positions.sort()
+    return found
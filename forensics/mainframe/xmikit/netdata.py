@@ -0,0 +1,392 @@
+"""
+NETDATA (TSO TRANSMIT / XMIT) structure: segments, control records and text units.
+
+A NETDATA stream is a sequence of segments, each a length byte (including the
+two header bytes), a flags byte and up to 253 bytes of data.  Control records
+(INMR01..INMR07) start with their EBCDIC name and carry text units:
+key(2) count(2) then count x (length(2) data).  Walking the stream only reads
+segment headers, so metadata costs a header walk rather than a decode.
+"""
+
+import struct
+from collections import namedtuple
+from datetime import datetime
+
+SEG_FIRST = 0x80    # first segment of a record
+SEG_LAST = 0x40     # last segment of a record
+SEG_CONTROL = 0x20  # segment belongs to a control record
+SEG_RECNUM = 0x10   # record number of the next record
+
+U16 = struct.Struct(">H")
+
+Segment = namedtuple("Segment", "offset flags data")
+ControlRecord = namedtuple("ControlRecord", "offset name file_number units")
+Record = namedtuple("Record", "file_number offset data")
+
+CHAR, INT, HEX = "char", "int", "hex"
+
+# text unit key -> (name, value type)
+TEXT_UNITS = {
+    0x0001: ("INMDDNAM", CHAR),
+    0x0002: ("INMDSNAM", CHAR),
+    0x0003: ("INMMEMBR", CHAR),
+    0x000B: ("INMSECND", INT),
+    0x000C: ("INMDIR", INT),
+    0x0022: ("INMEXPDT", CHAR),
+    0x0028: ("INMTERM", HEX),
+    0x0030: ("INMBLKSZ", INT),
+    0x003C: ("INMDSORG", INT),
+    0x0042: ("INMLRECL", INT),
+    0x0049: ("INMRECFM", INT),
+    0x1001: ("INMTNODE", CHAR),
+    0x1002: ("INMTUID", CHAR),
+    0x1011: ("INMFNODE", CHAR),
+    0x1012: ("INMFUID", CHAR),
+    0x1020: ("INMLREF", CHAR),
+    0x1021: ("INMLCHG", CHAR),
+    0x1022: ("INMCREAT", CHAR),
+    0x1023: ("INMFVERS", INT),
+    0x1024: ("INMFTIME", CHAR),
+    0x1025: ("INMTTIME", CHAR),
+    0x1026: ("INMFACK", CHAR),
+    0x1027: ("INMERRCD", CHAR),
+    0x1028: ("INMUTILN", CHAR),
+    0x1029: ("INMUSERP", CHAR),
+    0x102A: ("INMRECCT", CHAR),
+    0x102C: ("INMSIZE", INT),
+    0x102F: ("INMNUMF", INT),
+    0x8012: ("INMTYPE", INT),
+}
+
+# control records followed by a 4-byte file number before their text units
+NUMBERED_RECORDS = {"INMR02"}
+
+DSORG = {0x0008: "VSAM", 0x0200: "PO", 0x4000: "PS", 0x8000: "IS"}
+
+
+class NetdataError(ValueError):
+    pass
+
+
+def recfm_string(recfm):
+    """INMRECFM bits as the usual F/V/U + B/S/A/M letters"""
+    form = {0x8000: "F", 0x4000: "V", 0xC000: "U"}.get(recfm & 0xC000, "?")
+    for bit, letter in ((0x1000, "B"), (0x0800, "S"), (0x0400, "A"), (0x0200, "M")):
+        if recfm & bit:
+            form += letter
+    return form
+
+
+def parse_time(value):
+    """INMFTIME/INMCREAT style yyyymmdd[hhmmss[uuuuuu]] -> datetime, or None"""
+    digits = value.strip()
+    for fmt, width in (("%Y%m%d%H%M%S%f", 20), ("%Y%m%d%H%M%S", 14), ("%Y%m%d", 8)):
+        if len(digits) >= width:
+            try:
+                return datetime.strptime(digits[:width], fmt)
+            except ValueError:
+                return None
+    return None
+
+
+def decode_unit(kind, values, codepage):
+    if kind == INT:
+        return [int.from_bytes(v, "big") for v in values]
+    if kind == CHAR:
+        return [bytes(v).decode(codepage) for v in values]
+    return [bytes(v).hex() for v in values]
+
+
+def parse_text_units(buf, pos=0, codepage="cp037"):
+    """Decode the text units in buf[pos:] into {name: value}
+
+    INMDSNAM qualifiers are joined with dots; other multi-valued units stay lists.
+    Unknown keys are kept as hex under "KEY_xxxx".
+    """
+    units = {}
+    end = len(buf)
+    while pos + 4 <= end:
+        key, count = struct.unpack_from(">HH", buf, pos)
+        pos += 4
+        values = []
+        for _ in range(count):
+            if pos + 2 > end:
+                raise NetdataError(f"text unit {key:04x} truncated")
+            (length,) = U16.unpack_from(buf, pos)
+            pos += 2
+            if pos + length > end:
+                raise NetdataError(f"text unit {key:04x} truncated")
+            values.append(buf[pos:pos + length])
+            pos += length
+        name, kind = TEXT_UNITS.get(key, (f"KEY_{key:04X}", HEX))
+        decoded = decode_unit(kind, values, codepage)
+        if name == "INMDSNAM":
+            units[name] = ".".join(decoded)
+        else:
+            units[name] = decoded[0] if len(decoded) == 1 else decoded
+    return units
+
+
+def stream_segments(chunks, base=0):
+    """Yield every Segment from an iterable of byte chunks by hopping length bytes
+
+    Segment data is a memoryview into the chunk it arrived in; only a segment
+    straddling two chunks (at most 255 bytes) is copied.  `base` is the stream
+    offset of the first chunk.
+    """
+    tail = b""
+    for chunk in chunks:
+        view = memoryview(chunk)
+        pos = 0
+        if tail:
+            need = tail[0] - len(tail)
+            if need > len(view):
+                tail += bytes(view)
+                continue
+            seg = memoryview(tail + bytes(view[:need]))
+            yield Segment(base, seg[1], seg[2:])
+            base += len(seg)
+            pos = need
+        end = len(view)
+        while pos < end:
+            length = view[pos]
+            if length < 2:
+                raise NetdataError(f"invalid segment length {length} at offset {base}")
+            if pos + length > end:
+                break
+            yield Segment(base, view[pos + 1], view[pos + 2:pos + length])
+            base += length
+            pos += length
+        tail = bytes(view[pos:])
+    if tail:
+        raise NetdataError(f"segment at offset {base} runs past the end of the data")
+
+
+def iter_segments(data, start=0):
+    """Yield every Segment of an in-memory stream (see stream_segments)"""
+    return stream_segments([memoryview(data)[start:]], start)
+
+
+def parse_control_record(offset, body, codepage="cp037"):
+    name = bytes(body[:6]).decode(codepage)
+    if not name.startswith("INMR"):
+        raise NetdataError(f"control record at offset {offset} has no INMRnn name")
+    pos = 6
+    file_number = None
+    if name in NUMBERED_RECORDS and len(body) >= 10:
+        file_number = int.from_bytes(body[6:10], "big")
+        pos = 10
+    return ControlRecord(offset, name, file_number, parse_text_units(body, pos, codepage))
+
+
+def control_spans(data, codepage="cp037"):
+    """(start, end) byte ranges of consecutive control record segments, up to INMR06
+
+    These are the text unit headers of the transmission; the data segments
+    between them hold the datasets.  Only segment headers are read.
+    """
+    spans = []
+    end_name = "INMR06".encode(codepage)
+    last = False
+    for seg in iter_segments(data):
+        if not seg.flags & SEG_CONTROL:
+            continue
+        if seg.flags & SEG_FIRST:
+            last = bytes(seg.data[:6]) == end_name
+        end = seg.offset + 2 + len(seg.data)
+        if spans and spans[-1][1] == seg.offset:
+            spans[-1] = (spans[-1][0], end)
+        else:
+            spans.append((seg.offset, end))
+        if last and seg.flags & SEG_LAST:
+            break  # end of transmission; anything after is card padding
+    return spans
+
+
+def read_control_records(data, codepage="cp037"):
+    """All control records up to and including INMR06; data segments are skipped unread"""
+    records = []
+    parts = []
+    start = None
+    for seg in iter_segments(data):
+        if not seg.flags & SEG_CONTROL:
+            continue
+        if seg.flags & SEG_FIRST:
+            parts, start = [], seg.offset
+        parts.append(seg.data)
+        if seg.flags & SEG_LAST:
+            rec = parse_control_record(start, b"".join(parts), codepage)
+            records.append(rec)
+            if rec.name == "INMR06":  # end of transmission; anything after is card padding
+                break
+    return records
+
+
+class Header:
+    """Typed view of the INMR01 / INMR02 metadata of a transmission"""
+
+    def __init__(self, records):
+        self.records = records
+        inmr01 = next((r.units for r in records if r.name == "INMR01"), {})
+        self.origin_node = inmr01.get("INMFNODE")
+        self.origin_user = inmr01.get("INMFUID")
+        self.dest_node = inmr01.get("INMTNODE")
+        self.dest_user = inmr01.get("INMTUID")
+        self.timestamp = parse_time(inmr01["INMFTIME"]) if "INMFTIME" in inmr01 else None
+        self.file_count = inmr01.get("INMNUMF")
+        self.files = [DatasetInfo(r) for r in records if r.name == "INMR02"]
+
+    def file(self, number):
+        """The INMR02s of one file; a PDS has an IEBCOPY and an INMCOPY record"""
+        return [info for info in self.files if info.file_number == number]
+
+    def __repr__(self):
+        return (f"Header({self.origin_node}.{self.origin_user} -> {self.dest_node}.{self.dest_user}, "
+                f"{self.timestamp}, {len(self.files)} files)")
+
+
+class DatasetInfo:
+    """One INMR02 record: the dataset attributes and the utility that unloaded it"""
+
+    def __init__(self, record):
+        units = record.units
+        self.file_number = record.file_number
+        self.utility = units.get("INMUTILN")
+        self.dsname = units.get("INMDSNAM")
+        self.lrecl = units.get("INMLRECL")
+        self.blksize = units.get("INMBLKSZ")
+        self.recfm = units.get("INMRECFM")
+        self.size = units.get("INMSIZE")
+        dsorg = units.get("INMDSORG")
+        self.dsorg = DSORG.get(dsorg, dsorg)
+
+    @property
+    def recfm_name(self):
+        return recfm_string(self.recfm) if self.recfm is not None else None
+
+    def __repr__(self):
+        return (f"DatasetInfo(#{self.file_number} {self.dsname or '?'} {self.utility} "
+                f"DSORG={self.dsorg} RECFM={self.recfm_name} LRECL={self.lrecl} BLKSIZE={self.blksize})")
+
+
+def read_header(data, codepage="cp037"):
+    return Header(read_control_records(data, codepage))
+
+
+class Unblocker:
+    """Splits the reassembled data records of one dataset into logical records
+
+    F: fixed LRECL slices (a short final block yields a short record).
+    V: RDW-prefixed records, with an optional leading BDW; spanned (VS) pieces
+       are joined across blocks.  With INMRECFM X'0002' the records carry no
+       RDW and each data record already is one logical record.
+    U: every data record is one logical record.
+    Records are memoryview slices of the block; only spanned records are copied.
+    """
+
+    def __init__(self, recfm, lrecl):
+        self.recfm = recfm or 0
+        self.lrecl = lrecl
+        self.spanned = None
+
+    def records(self, block):
+        view = memoryview(block)
+        form = self.recfm & 0xC000
+        if form == 0x8000 and self.lrecl:
+            lrecl = self.lrecl
+            for pos in range(0, len(view), lrecl):
+                yield view[pos:pos + lrecl]
+        elif form == 0x4000 and not self.recfm & 0x0002:
+            yield from self._variable(view)
+        else:
+            yield view
+
+    @staticmethod
+    def _rdw_chain_fits(view, pos):
+        # True when the RDW lengths from pos add up exactly to the end of the block
+        end = len(view)
+        while pos + 4 <= end:
+            (length,) = U16.unpack_from(view, pos)
+            if length < 4:
+                return False
+            pos += length
+        return pos == end
+
+    def _variable(self, view):
+        pos = 0
+        end = len(view)
+        # a block holding one record looks just like a BDW (its RDW gives the block length,
+        # followed by 00 00), so a BDW is only taken when the RDWs after it fill the block
+        if (end >= 4 and U16.unpack_from(view, 0)[0] == end and view[2] == view[3] == 0
+                and self._rdw_chain_fits(view, 4)):
+            pos = 4  # block descriptor word
+        while pos + 4 <= end:
+            (length,) = U16.unpack_from(view, pos)
+            if length < 4 or pos + length > end:
+                raise NetdataError(f"invalid RDW length {length} in block")
+            piece = view[pos + 4:pos + length]
+            span = view[pos + 2]  # 0 complete, 1 first, 2 last, 3 middle segment
+            pos += length
+            if span == 0:
+                yield piece
+            elif span == 1:
+                self.spanned = bytearray(piece)
+            elif self.spanned is None:
+                raise NetdataError("spanned record continues without a first segment")
+            else:
+                self.spanned += piece
+                if span == 2:
+                    yield memoryview(bytes(self.spanned))
+                    self.spanned = None
+
+
+def iter_records(chunks, codepage="cp037", unblock=True, base=0):
+    """Yield ControlRecords and the data Records of every transmitted file, in stream order
+
+    `chunks` is an iterable of byte chunks (use [data] for an in-memory stream).
+    Data records are reassembled from their first/last segments and, with
+    `unblock`, split into logical records using the RECFM/LRECL of the file's
+    INMR02.  A record that fits one segment is a view of its chunk, so memory
+    stays bounded by the chunk size plus the largest record.  Stops at INMR06.
+    """
+    files = {}       # file number -> its INMR02s (IEBCOPY + INMCOPY for a PDS), in stream order
+    started = 0      # INMR03s seen; the n-th one starts the data of the n-th file
+    current = None
+    unblocker = None
+    parts = []
+    start = None
+    for seg in stream_segments(chunks, base):
+        if seg.flags & SEG_RECNUM:
+            continue
+        if seg.flags & SEG_FIRST:
+            parts, start = [], seg.offset
+        parts.append(seg.data)
+        if not seg.flags & SEG_LAST:
+            continue
+        body = parts[0] if len(parts) == 1 else memoryview(b"".join(parts))
+        parts = []
+        if seg.flags & SEG_CONTROL:
+            rec = parse_control_record(start, body, codepage)
+            yield rec
+            if rec.name == "INMR02":
+                files.setdefault(rec.file_number, []).append(DatasetInfo(rec))
+            elif rec.name == "INMR03":
+                numbers = list(files)
+                # the last INMR02 of a file describes the records as transmitted
+                current = files[numbers[started]][-1] if started < len(numbers) else None
+                unblocker = Unblocker(current.recfm, current.lrecl) if current else None
+                started += 1
+            elif rec.name == "INMR06":
+                return
+        else:
+            number = current.file_number if current else None
+            if unblock and unblocker is not None:
+                for logical in unblocker.records(body):
+                    yield Record(number, start, logical)
+            else:
+                yield Record(number, start, body)
+
+
+def iter_data_records(chunks, codepage="cp037", unblock=True):
+    """Only the data Records of iter_records()"""
+    return (r for r in iter_records(chunks, codepage, unblock) if isinstance(r, Record))
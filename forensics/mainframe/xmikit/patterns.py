@@ -0,0 +1,154 @@
+"""
+Regular expressions and string helpers shared by the analysis plugins.
+"""
+
+import codecs
+import re
+
+from .matcher import Matcher
+
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`[\]]+')
+DATE_RE = re.compile(r"\d{2}[/-]\d{2}[/-]\d{2,4}|\d{4}[/-]\d{2}[/-]\d{2}")
+TEXT_BLOCK_RE = re.compile(r"[A-Za-z][A-Za-z0-9\s\.,;:!?\-_(){}[\]]{50,}")
+IDENTIFIER_RE = re.compile(r"\b[a-zA-Z][a-zA-Z0-9._-]{2,15}\b")
+READABLE_SEQ_RE = re.compile(r"[A-Za-z0-9@._-]{5,}")
+
+
+def latin1_set(pattern):
+    """The bytes whose latin-1 character matches `pattern`, escaped for a bytes character set"""
+    return re.escape(bytes(b for b in range(256) if re.fullmatch(pattern, chr(b))))
+
+
+# the same expressions over raw bytes read as latin-1; bytes regexes take \s and \w
+# (hence \b) as ASCII only, so those are spelled out as the latin-1 sets
+LATIN1_SPACE = latin1_set(r"\s")
+LATIN1_WORD = latin1_set(r"\w")
+LATIN1_BOUNDARY = rb"(?:(?<=[%s])(?![%s])|(?<![%s])(?=[%s]))" % ((LATIN1_WORD,) * 4)
+EMAIL_BYTES_RE = re.compile(EMAIL_RE.pattern.encode())
+TEXT_BLOCK_BYTES_RE = re.compile(TEXT_BLOCK_RE.pattern.encode().replace(rb"\s", LATIN1_SPACE))
+IDENTIFIER_BYTES_RE = re.compile(IDENTIFIER_RE.pattern.encode().replace(rb"\b", LATIN1_BOUNDARY))
+
+WINDOW_SIZE = 1 << 20
+WINDOW_MARGIN = 4096
+
+# typical mainframe user ID shapes
+USER_ID_PATTERNS = [
+    re.compile(r"\b[A-Z][A-Z0-9]{2,7}\b"),
+    re.compile(r"\b[A-Z]{3,8}[0-9]{0,3}\b"),
+    re.compile(r"USER\w+"),
+    re.compile(r"ID[A-Z0-9]+"),
+]
+
+# common English words that look like user IDs
+COMMON_WORDS = {
+    "THE", "AND", "FOR", "NOT", "BUT", "YOU", "ALL", "CAN", "HER",
+    "WAS", "ONE", "OUR", "HAD", "WITH", "HAVE", "THIS", "WILL",
+    "ARE", "FROM", "THEY", "KNOW", "WANT", "BEEN", "GOOD", "MUCH",
+    "SOME", "TIME", "VERY", "WHEN", "COME", "HERE", "HOW", "JUST",
+    "LIKE", "LONG", "MAKE", "MANY", "OVER", "SUCH", "TAKE", "THAN",
+    "THEM", "WELL", "WERE",
+}
+
+
+def keyword_regex(keyword):
+    """The keyword followed by any word characters, case-insensitive"""
+    return re.compile(re.escape(keyword) + r"\w*", re.IGNORECASE)
+
+
+def find_user_ids(text):
+    """Sorted potential user identifiers, without common words"""
+    return filter_user_ids(u for pattern in USER_ID_PATTERNS for u in pattern.findall(text))
+
+
+def filter_user_ids(found):
+    """Sorted distinct user ID matches, without common words"""
+    return sorted(u for u in set(found) if len(u) >= 3 and u not in COMMON_WORDS)
+
+
+def find_decoded(data, codepage, regexes, size=WINDOW_SIZE, margin=WINDOW_MARGIN):
+    """[(offset, match), ...] for each str regex over data in a single-byte code page
+
+    The buffer is decoded one window of `size` bytes at a time, with `margin`
+    bytes of context either side, so a mapping is never decoded whole.  A match
+    is taken from the window it starts in and scanning resumes where the
+    previous one ended, so as long as a match and the context its lookarounds
+    need fit in the margin, the matches are those of finditer() over the whole
+    decoded text.
+    """
+    found = [[] for _ in regexes]
+    resume = [0] * len(regexes)
+    for start in range(0, len(data), size):
+        stop = start + size
+        base = max(0, start - margin)
+        text = codecs.decode(data[base:stop + margin], codepage, "replace")
+        for i, regex in enumerate(regexes):
+            for m in regex.finditer(text, max(resume[i], start) - base):
+                if base + m.start() >= stop:
+                    break
+                found[i].append((base + m.start(), m.group()))
+                resume[i] = base + m.end()
+    return found
+
+
+def extract_readable_content(data, min_len=5):
+    """Runs of printable ASCII (plus whitespace) at least min_len long, one per line"""
+    runs = re.findall(rb"[\t\n\r\x20-\x7e]{%d,}" % min_len, data)
+    return "\n".join(r.decode("ascii") for r in runs) if runs else None
+
+
+def search_chunks(chunks, needles, ignore_case=False):
+    """Yield (offset, needle) for every occurrence of the byte needles in a chunked stream
+
+    One Aho-Corasick pass (see matcher.Matcher), so matches spanning a chunk
+    boundary are found once and the cost does not grow with the number of
+    needles; stop iterating to stop the producer.
+    """
+    return Matcher(needles, ignore_case=ignore_case).iter_chunks(chunks)
+
+
+def readable_runs(chunks, min_len=5, limit=1 << 20):
+    """Yield printable runs (str) of at least min_len from a stream of decoded text chunks
+
+    A run reaching the end of a chunk is held back until it ends, up to `limit`
+    characters, so runs are not split at chunk boundaries.  One held past the
+    limit is emitted as it stands and the characters after it start a new run.
+    """
+    run_re = re.compile(r"[\t\x20-\x7e]{%d,}" % min_len)
+    pending = ""
+    for chunk in chunks:
+        window = pending + chunk
+        pending = ""
+        cut = False  # the run at the end of the window was emitted at the limit
+        for m in run_re.finditer(window):
+            if m.end() == len(window):
+                if len(m.group()) < limit:
+                    pending = m.group()
+                    continue
+                cut = True
+            yield m.group()
+        if not pending and not cut:
+            # a short printable stub at the end may grow into a run with the next chunk
+            stub = re.search(r"[\t\x20-\x7e]*\Z", window).group()
+            pending = stub[-(min_len - 1):] if min_len > 1 else ""
+    if len(pending) >= min_len:
+        yield pending
+
+
+def context(text, pos, length, width):
+    """`width` characters either side of a match, on one line"""
+    snippet = text[max(0, pos - width):pos + length + width]
+    return " ".join(snippet.replace("\n", " ").replace("\r", " ").split())
+
+
+def decoded_context(data, codepage, pos, length, width):
+    """context() of a match in raw bytes, decoding only the bytes around it"""
+    start = max(0, pos - width)
+    return context(codecs.decode(data[start:pos + length + width], codepage, "replace"), pos - start, length, width)
+
+
+def preview_lines(text, limit, width=100):
+    """The first non-empty lines of text, shortened for display"""
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    shown = [line[:width] + ("..." if len(line) > width else "") for line in lines[:limit]]
+    return lines, shown
@@ -0,0 +1,187 @@
+"""
+IEBCOPY unload (the INMCOPY form of a transmitted PDS).
+
+The unload is a series of logical records:
+  COPYR1      dataset attributes and the geometry of the source device
+  COPYR2      the extents of the source dataset (to map TTRs to CCHHR)
+  directory   blocks of 12-byte FMBBCCHHRKDD header, 8-byte key, 256-byte data
+  members     blocks of 12-byte header plus data; DD=0 ends a member
+Listing members only reads COPYR1, COPYR2 and the directory; the data records
+that follow are read only when members are extracted, in one walk over their
+block headers that copies just the blocks of the requested members.
+"""
+
+import itertools
+import struct
+from collections import namedtuple
+
+from .netdata import NetdataError, Unblocker
+
+COPYR1_ID = b"\xca\x6d\x0f"
+BLOCK_HEADER = struct.Struct(">BBHHHBBH")  # F M BB CC HH R KL DL
+DIR_END = b"\xff" * 8
+
+Member = namedtuple("Member", "name ttr alias userdata")
+Extent = namedtuple("Extent", "start_cc start_hh end_cc end_hh tracks")
+
+
+class PDSError(NetdataError):
+    pass
+
+
+def is_unload(record):
+    """True if a logical record is an IEBCOPY COPYR1"""
+    return len(record) >= 4 and bytes(record[1:4]) == COPYR1_ID
+
+
+def iter_blocks(record):
+    """(cc, hh, r, key, data) for every block in one unload record"""
+    pos = 0
+    end = len(record)
+    while pos + BLOCK_HEADER.size <= end:
+        _f, _m, _bb, cc, hh, r, kl, dl = BLOCK_HEADER.unpack_from(record, pos)
+        pos += BLOCK_HEADER.size
+        if pos + kl + dl > end:
+            raise PDSError("unload block runs past the end of its record")
+        yield cc, hh, r, record[pos:pos + kl], record[pos + kl:pos + kl + dl]
+        pos += kl + dl
+
+
+def parse_directory_block(data, codepage="cp037"):
+    """Members in one 256-byte directory block, and whether it holds the end marker"""
+    (used,) = struct.unpack_from(">H", data, 0)
+    members = []
+    pos = 2
+    while pos + 12 <= used:
+        name = bytes(data[pos:pos + 8])
+        if name == DIR_END:
+            return members, True
+        ttr = int.from_bytes(data[pos + 8:pos + 11], "big")
+        c = data[pos + 11]
+        halfwords = c & 0x1F
+        members.append(Member(name.decode(codepage).rstrip(), ttr, bool(c & 0x80),
+                              bytes(data[pos + 12:pos + 12 + 2 * halfwords])))
+        pos += 12 + 2 * halfwords
+    return members, False
+
+
+class PDSUnload:
+    """Member index of an IEBCOPY unload given as an iterable of logical records
+
+    Records are typically the memoryviews from netdata.iter_records().  Only
+    COPYR1, COPYR2 and the directory are read here; the data records after the
+    directory terminator stay unread in the iterable until extract() walks them,
+    once, copying nothing but the blocks handed out.
+    """
+
+    def __init__(self, records, codepage="cp037"):
+        records = iter(records)
+        self.codepage = codepage
+        copyr1 = next(records, None)
+        if copyr1 is None or not is_unload(copyr1):
+            raise PDSError("not an IEBCOPY unload (no COPYR1)")
+        copyr2 = next(records, None)
+        if copyr2 is None:
+            raise PDSError("IEBCOPY unload ends after its COPYR1")
+        self._copyr1(copyr1)
+        self._copyr2(copyr2)
+        self.members = {}
+        self._data = self._directory(records)
+
+    def _copyr1(self, rec):
+        self.pdse = bool(rec[0] & 0x01)
+        self.dsorg, self.blksize, self.lrecl = struct.unpack_from(">HHH", rec, 4)
+        self.recfm = rec[10] << 8  # DSCB RECFM byte, same bits as INMRECFM's high byte
+        self.keylen = rec[11]
+        self.tracks_per_cylinder = struct.unpack_from(">H", rec, 26)[0] if len(rec) >= 28 else 0
+
+    def _copyr2(self, rec):
+        self.extents = []
+        for pos in range(16, min(len(rec), 16 + 16 * 16), 16):
+            start_cc, start_hh, end_cc, end_hh, tracks = struct.unpack_from(">HHHHH", rec, pos + 6)
+            if tracks:
+                self.extents.append(Extent(start_cc, start_hh, end_cc, end_hh, tracks))
+
+    def _directory(self, records):
+        # reads up to the record holding the end marker; returns the data records, that one first
+        for rec in records:
+            for _cc, _hh, _r, key, data in iter_blocks(rec):
+                if len(key) != 8 or len(data) != 256:
+                    continue
+                members, done = parse_directory_block(data, self.codepage)
+                for m in members:
+                    self.members[m.name] = m
+                if done:
+                    return itertools.chain([rec], records)
+        raise PDSError("directory has no end marker")
+
+    def __iter__(self):
+        return iter(self.members.values())
+
+    def __len__(self):
+        return len(self.members)
+
+    def __contains__(self, name):
+        return name in self.members
+
+    def cchhr(self, ttr):
+        """Absolute (cylinder, head, record) of a relative TTR"""
+        if not self.tracks_per_cylinder:
+            raise PDSError("COPYR1 has no device geometry to locate member data with")
+        track, r = ttr >> 8, ttr & 0xFF
+        for ext in self.extents:
+            if track < ext.tracks:
+                absolute = ext.start_cc * self.tracks_per_cylinder + ext.start_hh + track
+                return absolute // self.tracks_per_cylinder, absolute % self.tracks_per_cylinder, r
+            track -= ext.tracks
+        raise PDSError(f"TTR {ttr:06x} is outside the dataset extents")
+
+    def extract(self, names):
+        """(names, blocks) for each of the named members, in unload order, in one pass
+
+        `names` is a tuple, as aliases share their data; `blocks` yields the
+        member's data blocks up to its end-of-file block and, like a group of
+        itertools.groupby, is only valid until the next pair is taken.  The data
+        records can be walked once, so this can only be called once.
+        """
+        if self._data is None:
+            raise PDSError("the member data of this unload has already been read")
+        records, self._data = self._data, None
+        starts = {}
+        for name in dict.fromkeys(names):
+            starts.setdefault(self.cchhr(self.members[name].ttr), []).append(name)
+        blocks = ((cc, hh, r, data) for rec in records
+                  for cc, hh, r, key, data in iter_blocks(rec) if not key)  # directory blocks are keyed
+        for cc, hh, r, data in blocks:
+            found = starts.pop((cc, hh, r), None)
+            if found is None:
+                continue
+            member = self._member_blocks(data, blocks)
+            yield tuple(found), member
+            for _data in member:  # skip whatever the caller left unread
+                pass
+            if not starts:
+                return
+        missing = ", ".join(name for found in starts.values() for name in found)
+        raise PDSError(f"data of member {missing} not found in the unload")
+
+    @staticmethod
+    def _member_blocks(data, blocks):
+        while data:
+            yield data
+            data = next(blocks, (0, 0, 0, b""))[3]
+
+    def blocks(self, name):
+        """The data blocks of one member, as memoryviews, up to its end-of-file block"""
+        for _names, blocks in self.extract([name]):
+            yield from blocks
+
+    def read(self, name):
+        """A member's data, blocks joined"""
+        return b"".join(self.blocks(name))
+
+    def logical_records(self, name):
+        """A member's logical records, unblocked using the PDS RECFM/LRECL"""
+        unblocker = Unblocker(self.recfm, self.lrecl)
+        for block in self.blocks(name):
+            yield from unblocker.records(block)
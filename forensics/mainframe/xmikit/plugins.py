@@ -0,0 +1,519 @@
+"""
+Analysis plugins.  Each one is a function taking a Context; they all share the
+Context's Archive, so the transmission is read and decoded only once per run.
+"""
+
+import codecs
+import itertools
+import zlib
+from collections import namedtuple
+from pathlib import Path
+
+from . import patterns
+from . import convert, deflatescan, detect
+from .ebcdic import CODEPAGES, EncodedSearch, search_netdata_headers
+from .matcher import find_all
+from .netdata import Record, control_spans, iter_records
+from .pds import PDSUnload, is_unload
+from .zipscan import (SIGNATURES, ZipError, entry_data, find_all_positions, inflate_entry,
+                      inflate_parallel, iter_inflate, try_standard_decompression)
+
+DEFAULT_KEYWORDS = ["FIRE", "VIPER"]
+
+Plugin = namedtuple("Plugin", "name help func")
+
+PLUGINS = {}
+
+
+def plugin(name, help):
+    """Register an analysis function under `name`"""
+
+    def register(func):
+        PLUGINS[name] = Plugin(name, help, func)
+        return func
+
+    return register
+
+
+class Context:
+    """What a plugin gets: the shared archive, run options and an output directory"""
+
+    def __init__(self, archive, outdir, codepage="cp037", keywords=DEFAULT_KEYWORDS, members=None,
+                 workers=1, inflate_budget=None, bit_offsets=False):
+        self.archive = archive
+        self.outdir = Path(outdir)
+        self.codepage = codepage
+        self.keywords = keywords
+        self.members = members  # PDS members to extract; None extracts all of them
+        self.workers = workers  # threads inflating ZIP members; 1 keeps the serial recovery path
+        self.inflate_budget = inflate_budget  # bytes of each member the streaming scans may inflate
+        self.bit_offsets = bit_offsets  # deflate plugin: also try the 7 bit offsets inside each byte
+        self.outdir.mkdir(parents=True, exist_ok=True)
+
+    def output(self, name):
+        return self.outdir / name
+
+    def write_text(self, name, text):
+        path = self.output(name)
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def write_bytes(self, name, data):
+        path = self.output(name)
+        path.write_bytes(data)
+        return path
+
+
+def run(archive, outdir, names=None, **options):
+    """Run the named plugins (default: all) against one decoded archive"""
+    ctx = Context(archive, outdir, **options)
+    for name in names or PLUGINS:
+        p = PLUGINS[name]
+        print(f"\n{p.name.upper()}: {p.help}")
+        print("=" * 60)
+        try:
+            p.func(ctx)
+        except Exception as e:
+            print(f"  {name} failed: {type(e).__name__}: {e}")
+    return ctx
+
+
+def safe_name(name, limit=64):
+    return name.replace("/", "_").replace("\\", "_")[:limit]
+
+
+def encode_needles(texts, encoding, warn=True):
+    """{text: bytes} for the texts `encoding` can represent; the others are skipped with a warning"""
+    encoded = {}
+    for text in texts:
+        try:
+            encoded[text] = text.encode(encoding)
+        except UnicodeEncodeError:
+            if warn:
+                print(f"  '{text}' has no {encoding} encoding; skipped")
+    return encoded
+
+
+@plugin("structure", "file overview and ZIP signature map")
+def analyze_structure(ctx):
+    archive = ctx.archive
+    data = archive.data
+    print(f"File: {archive.path} ({archive.raw_size:,} bytes, {archive.encoding})")
+    print(f"Decoded size: {len(data):,} bytes")
+    print(f"First 32 bytes (hex): {data[:32].hex()}")
+    for sig, name in SIGNATURES:
+        positions = find_all_positions(data, sig)
+        if positions:
+            print(f"{name} ({sig.hex()}): {len(positions)} found at {positions}")
+
+
+@plugin("netdata", "NETDATA control records and dataset attributes")
+def show_netdata_header(ctx):
+    header = ctx.archive.header
+    print(f"From: {header.origin_node}.{header.origin_user}")
+    print(f"To: {header.dest_node}.{header.dest_user}")
+    print(f"Sent: {header.timestamp}")
+    print(f"Files: {header.file_count}")
+    for info in header.files:
+        print(f"  {info}")
+    for rec in header.records:
+        number = f" file {rec.file_number}" if rec.file_number is not None else ""
+        print(f"{rec.name}{number} at offset {rec.offset}: {rec.units}")
+
+
+@plugin("datasets", "reassemble and unblock the transmitted datasets")
+def extract_datasets(ctx):
+    outputs = {}
+    counts = {}
+    try:
+        for rec in iter_records([ctx.archive.data]):
+            if not isinstance(rec, Record):
+                continue
+            f = outputs.get(rec.file_number)
+            if f is None:
+                f = outputs[rec.file_number] = ctx.output(f"dataset_{rec.file_number}.dat").open("wb")
+                counts[rec.file_number] = 0
+            f.write(rec.data)
+            counts[rec.file_number] += 1
+    finally:
+        for f in outputs.values():
+            f.close()
+    infos = {info.file_number: info for info in ctx.archive.header.files}
+    for number, count in counts.items():
+        info = infos.get(number)
+        print(f"File {number}: {count:,} logical records -> {ctx.output(f'dataset_{number}.dat')}")
+        if info is not None:
+            print(f"  {info}")
+        data = ctx.archive.datasets[number]
+        regions = detect.detect_regions(data)
+        if not any(r.kind == "text" for r in regions):
+            continue
+        fixed = info is not None and info.recfm is not None and info.recfm & 0xC000 == 0x8000
+        path = ctx.output(f"dataset_{number}.txt")
+        convert.write_converted(path, data, codepage=ctx.codepage, regions=regions,
+                                lrecl=info.lrecl if fixed else None)
+        print(f"  Text regions converted from {ctx.codepage} -> {path}")
+
+
+@plugin("pds", "list the members of transmitted PDSs (IEBCOPY unloads) and extract them")
+def extract_pds_members(ctx):
+    # files follow each other in the stream: take each one's records as they come, so only
+    # the directory of an unload is read before listing and member data only when extracted
+    records = (r for r in iter_records([ctx.archive.data], ctx.codepage, unblock=False)
+               if isinstance(r, Record))
+    found = False
+    for number, group in itertools.groupby(records, key=lambda r: r.file_number):
+        first = next(group)
+        if not is_unload(first.data):
+            continue
+        found = True
+        pds = PDSUnload((r.data for r in itertools.chain([first], group)), ctx.codepage)
+        print(f"File {number}: {len(pds)} members, RECFM {pds.recfm:04x}, LRECL {pds.lrecl}, "
+              f"BLKSIZE {pds.blksize}{' (PDSE)' if pds.pdse else ''}")
+        for member in pds:
+            print(f"  {member.name:8s} TTR {member.ttr:06x}{' alias' if member.alias else ''}")
+        wanted = list(pds.members) if ctx.members is None else [m for m in ctx.members if m in pds]
+        missing = [m for m in ctx.members or [] if m not in pds]
+        if missing:
+            print(f"  Not in this PDS: {', '.join(missing)}")
+        if not wanted:
+            continue
+        outdir = ctx.output(f"dataset_{number}_members")
+        outdir.mkdir(exist_ok=True)
+        for names, blocks in pds.extract(wanted):
+            paths = [outdir / safe_name(name) for name in names]
+            files = [path.open("wb") for path in paths]
+            try:
+                for block in blocks:
+                    for f in files:
+                        f.write(block)
+            finally:
+                for f in files:
+                    f.close()
+            for name, path in zip(names, paths):
+                print(f"  {name} -> {path}")
+    if not found:
+        print("  No IEBCOPY unloads in this transmission (sequential datasets only)")
+
+
+@plugin("zip", "extract and decompress the embedded ZIP entries")
+def extract_zip_entries(ctx):
+    index = ctx.archive.zip_index
+    if index is not None and index.problems:
+        print(f"Central directory disagrees with local headers: {index.problems[:5]}")
+    data, entries = zip_source(ctx.archive)
+    how = "central directory" if index is not None else "signature scan of the raw buffer"
+    print(f"Found {len(entries)} ZIP entries ({how})")
+    if index is not None and ctx.workers > 1:
+        extract_zip_parallel(ctx, data, entries)
+        return
+    for entry in entries:
+        print(f"\n{entry.filename[:64]} at position {entry.position} "
+              f"(method {entry.method}, {entry.compressed_size:,} -> {entry.uncompressed_size:,} bytes)")
+        name = safe_name(entry.filename)
+        compressed = entry_data(data, entry)
+        if len(compressed) < entry.compressed_size:
+            print(f"  Data extends beyond the buffer ({len(compressed)} of {entry.compressed_size} bytes)")
+        ctx.write_bytes(f"{name}_compressed.bin", compressed)
+
+        desc, output = try_standard_decompression(compressed, entry.method)
+        if output is not None:
+            path = ctx.write_bytes(name, output)
+            print(f"  {desc} successful: {len(output):,} bytes -> {path}")
+            analyze_member(entry.filename, output)
+            continue
+
+        print("  Could not decompress; extracting readable sequences instead")
+        readable = patterns.READABLE_SEQ_RE.findall(compressed.decode("latin-1"))
+        if readable:
+            ctx.write_text(f"{name}_readable_sequences.txt", "\n".join(readable) + "\n")
+            print(f"  {len(readable)} readable sequences: {readable[:10]}")
+
+
+def extract_zip_parallel(ctx, data, entries):
+    """Inflate intact members on a thread pool, CRC-checked, writing each as it completes"""
+    failed = 0
+    for entry, output, error in inflate_parallel(data, entries, ctx.workers):
+        name = safe_name(entry.filename)
+        if error is not None:
+            failed += 1
+            print(f"\n{entry.filename[:64]}: {error}")
+            ctx.write_bytes(f"{name}_compressed.bin", entry_data(data, entry))
+            continue
+        path = ctx.write_bytes(name, output)
+        print(f"\n{entry.filename[:64]}: {len(output):,} bytes, CRC32 {entry.crc32:08x} ok -> {path}")
+        analyze_member(entry.filename, output)
+    print(f"\n{len(entries) - failed} of {len(entries)} members extracted with {ctx.workers} workers")
+
+
+@plugin("deflate", "scan every offset for raw deflate, zlib and gzip streams")
+def scan_deflate_streams(ctx):
+    datasets = ctx.archive.datasets
+    try:
+        numbers = list(datasets)
+    except ValueError as e:
+        print(f"  Datasets not reassembled ({e}); scanning the raw buffer only")
+        numbers = []
+    # one dataset is reassembled at a time, as its turn comes
+    sources = itertools.chain([("raw", ctx.archive.data)], ((f"dataset_{n}", datasets[n]) for n in numbers))
+    # a binary transmission is mapped from its file, which the scan workers can map as well
+    paths = {"raw": ctx.archive.path} if ctx.archive.encoding == "binary" else {}
+    outdir = ctx.output("deflate_streams")
+    report = []
+    for label, data in sources:
+        streams = deflatescan.scan(data, bits=ctx.bit_offsets, workers=ctx.workers, path=paths.get(label))
+        print(f"{label}: {len(streams)} streams in {len(data):,} bytes")
+        for s in streams:
+            where = f"{s.offset}" + (f".{s.bit}" if s.bit else "")
+            line = (f"{label} {where} {s.kind}: {s.consumed:,} -> {s.output_size:,} bytes"
+                    f"{'' if s.complete else ' (breaks off)'}")
+            report.append(line)
+            if len(report) <= 20:
+                print(f"  {line}")
+            outdir.mkdir(exist_ok=True)
+            (outdir / f"{label}_{where}_{s.kind}.bin").write_bytes(deflatescan.inflate_stream(data, s))
+    if len(report) > 20:
+        print(f"  ... {len(report) - 20} more")
+    if report:
+        ctx.write_text("deflate_streams.txt", "\n".join(report) + "\n")
+
+
+def zip_source(archive):
+    """(buffer, entries): the central directory index when there is one, else the signature scan"""
+    index = archive.zip_index
+    if index is not None:
+        return index.data, list(index)
+    return archive.data, archive.zip_entries
+
+
+def netdata_spans(data):
+    """(start, end) of the NETDATA control records in data, or none if it is no segment stream"""
+    try:
+        return control_spans(data)
+    except ValueError:
+        return []
+
+
+def span_boundaries(spans):
+    return [pos for span in spans for pos in span]
+
+
+def analyze_member(filename, data):
+    """Content checks for a decompressed member, keyed on the member name"""
+    try:
+        text, codepage = data.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        best = detect.detect(data)[0]
+        if best.confidence < detect.TEXT_THRESHOLD:
+            print(f"  Binary content: {data[:40].hex()}...")
+            return
+        text, codepage = codecs.decode(data, best.codepage, "replace"), best.codepage
+    lines, shown = patterns.preview_lines(text, 5)
+    print(f"  {codepage} text with {len(lines)} non-empty lines")
+    for line in shown:
+        print(f"    {line}")
+    upper = filename.upper()
+    if upper == "EMAILS":
+        emails = sorted(set(patterns.EMAIL_RE.findall(text)))
+        print(f"  {len(emails)} email addresses: {emails[:10]}")
+    elif upper in ("Q1", "Q2", "Q3", "Q4"):
+        questions = [line for line in lines if "?" in line]
+        print(f"  {len(questions)} questions")
+    elif upper == "USERS":
+        print(f"  Potential user IDs: {patterns.find_user_ids(text)[:20]}")
+
+
+@plugin("codepage", "rank code pages per region from byte histograms")
+def detect_codepages(ctx):
+    datasets = ctx.archive.datasets
+    try:
+        numbers = list(datasets)
+    except ValueError as e:
+        print(f"  Datasets not reassembled ({e}); raw buffer only")
+        numbers = []
+    members = []
+    zip_data, entries = zip_source(ctx.archive) if ctx.archive.zip_index is not None else (None, [])
+    for entry in entries:
+        try:
+            members.append((entry.filename, inflate_entry(zip_data, entry)))
+        except (zlib.error, ZipError) as e:
+            print(f"  {entry.filename[:64]}: could not inflate ({e})")
+    sources = itertools.chain([("raw", ctx.archive.data)], ((f"dataset_{n}", datasets[n]) for n in numbers),
+                              members)
+    for label, data in sources:
+        ranked = detect.detect(data)
+        print(f"\n{label[:64]} ({len(data):,} bytes): "
+              + ", ".join(f"{c.codepage} {c.score} ({c.confidence:.0%} text)" for c in ranked[:4]))
+        boundaries = span_boundaries(netdata_spans(data)) if label == "raw" else ()
+        for region in detect.detect_regions(data, boundaries=boundaries):
+            print(f"  {region.start:>8}-{region.end:<8} {region.kind:6s} "
+                  f"{region.codepage or '':8s} {region.confidence:.0%}")
+
+
+@plugin("strings", "readable strings, emails and identifiers in the decoded buffer and ZIP members")
+def extract_readable_strings(ctx):
+    # latin-1 maps bytes to characters one to one: the regexes run on the buffer itself
+    data = ctx.archive.data
+    emails = sorted(set(m.decode("latin-1") for m in patterns.EMAIL_BYTES_RE.findall(data)))
+    if emails:
+        ctx.write_text("extracted_emails.txt", "\n".join(emails))
+    print(f"  {len(emails)} unique email addresses")
+
+    blocks = patterns.TEXT_BLOCK_BYTES_RE.findall(data)
+    if blocks:
+        ctx.write_text("extracted_text_blocks.txt", "".join(
+            f"Block {i+1}:\n{' '.join(b.decode('latin-1').split())}\n\n" for i, b in enumerate(blocks)))
+    print(f"  {len(blocks)} readable text blocks")
+
+    identifiers = sorted(set(m.decode("latin-1") for m in patterns.IDENTIFIER_BYTES_RE.findall(data)))
+    if identifiers:
+        ctx.write_text("extracted_identifiers.txt", "\n".join(identifiers))
+    print(f"  {len(identifiers)} potential identifiers")
+
+    readable = patterns.extract_readable_content(data)
+    if readable:
+        ctx.write_text("readable_content.txt", readable)
+
+    zip_data, entries = zip_source(ctx.archive)
+    for entry in entries:
+        name = safe_name(entry.filename)
+        decoded = (codecs.decode(c, ctx.codepage, "replace")
+                   for c in iter_inflate(zip_data, entry, budget=ctx.inflate_budget))
+        count = 0
+        try:
+            with ctx.output(f"{name}_strings_{ctx.codepage}.txt").open("w", encoding="utf-8") as f:
+                for run in patterns.readable_runs(decoded):
+                    f.write(run + "\n")
+                    count += 1
+        except (zlib.error, ZipError) as e:
+            print(f"  {entry.filename[:64]}: could not inflate ({e})")
+            continue
+        print(f"  {entry.filename[:64]}: {count} readable {ctx.codepage} strings")
+
+
+@plugin("ebcdic", "EBCDIC decode with NETDATA headers, keyword hits, user IDs and emails")
+def analyze_ebcdic(ctx):
+    cp = ctx.codepage
+    # control records are cut out as regions of their own and, being text units, are
+    # converted from the configured code page even where the histogram says binary
+    spans = netdata_spans(ctx.archive.data)
+    regions = detect.detect_regions(ctx.archive.data, boundaries=span_boundaries(spans))
+    path = ctx.output(f"netdata_{cp}.txt")
+    size = convert.write_converted(path, ctx.archive.data, codepage=cp, regions=regions, text_spans=spans)
+    text_bytes = sum(r.end - r.start for r in regions if r.kind == "text")
+    unit_bytes = sum(end - start for start, end in spans)
+    print(f"{cp} conversion: {text_bytes:,} bytes in text regions, {unit_bytes:,} in NETDATA text units, "
+          f"binary as hex -> {path} ({size:,} bytes)")
+    # headers are found by their encoded bytes; everything else runs on bounded decoded windows
+    data = ctx.archive.data
+    print("\nNETDATA headers:")
+    for header, positions in search_netdata_headers(data, cp).items():
+        print(f"  {header}: {len(positions)} at {positions[:5]}{'...' if len(positions) > 5 else ''}")
+        print(f"    Context: ...{patterns.decoded_context(data, cp, positions[0], len(header), 50)}...")
+
+    keyword_res = [patterns.keyword_regex(keyword) for keyword in ctx.keywords]
+    found = patterns.find_decoded(data, cp, keyword_res + patterns.USER_ID_PATTERNS
+                                  + [patterns.EMAIL_RE, patterns.DATE_RE])
+    *user_hits, email_hits, date_hits = found[len(keyword_res):]
+
+    for keyword, hits in zip(ctx.keywords, found):
+        print(f"\n{keyword}: {len(hits)} matches")
+        for pos, match in hits[:5]:
+            print(f"  '{match}' at {pos}: ...{patterns.decoded_context(data, cp, pos, len(match), 100)}...")
+        if hits:
+            ctx.write_text(f"{keyword.lower()}_findings_{cp}.txt", "".join(
+                f"Found: {match} at position {pos}\nContext:\n"
+                f"{codecs.decode(data[max(0, pos-300):pos+len(match)+300], cp, 'replace')}\n"
+                + "-" * 50 + "\n\n" for pos, match in hits))
+
+    users = patterns.filter_user_ids(match for hits in user_hits for _pos, match in hits)
+    print(f"\n{len(users)} potential user identifiers: {users[:20]}")
+    if users:
+        ctx.write_text(f"user_identifiers_{cp}.txt", "\n".join(users) + "\n")
+
+    emails = sorted(set(match for _pos, match in email_hits))
+    print(f"{len(emails)} email addresses: {emails[:10]}")
+    dates = sorted(set(match for _pos, match in date_hits))
+    if dates:
+        print(f"Dates: {dates[:10]}")
+
+
+@plugin("search", "keyword search in the raw bytes, every EBCDIC code page and each ZIP entry")
+def search_keywords(ctx):
+    data = ctx.archive.data
+    variants = []
+    for keyword in ctx.keywords:
+        variants += [v for v in (keyword.upper(), keyword.lower(), keyword.capitalize()) if v not in variants]
+
+    print("Binary:")
+    fragments = {v[:3] for v in variants if len(v) > 3 and v[:3] == v[:3].upper()}
+    encoded = encode_needles(dict.fromkeys(variants + sorted(fragments)), "ascii")
+    found = find_all(data, list(encoded.values()))
+    for variant in variants:
+        positions = found.get(encoded.get(variant))
+        if positions:
+            print(f"  '{variant}' at {positions}")
+        partial = variant[:3]
+        if partial in fragments and found.get(encoded.get(partial)):
+            positions = found[encoded[partial]]
+            print(f"  '{partial}' fragments at {positions[:10]}{'...' if len(positions) > 10 else ''}")
+
+    # one scan of the raw bytes for every variant encoded in every code page;
+    # only the bytes around a hit are decoded, for display
+    print("\nCode pages:")
+    for hit in EncodedSearch(variants, CODEPAGES + ["ascii"]).finditer(data):
+        start = max(0, hit.offset - 100)
+        snippet = codecs.decode(data[start:hit.offset + len(hit.needle) + 100], hit.codepages[0], "replace")
+        m = patterns.keyword_regex(hit.needle).match(snippet, hit.offset - start)
+        print(f"  {'/'.join(hit.codepages)}: '{m.group()}' at {hit.offset}: "
+              f"...{patterns.context(snippet, m.start(), len(m.group()), 100)}...")
+
+    # members are inflated as a stream and dropped at the first hit of every keyword
+    print("\nZIP entries:")
+    needles = {}  # encoded variant -> the keywords it stands for (keywords may share variants)
+    for encoding in ("ascii", ctx.codepage):
+        for keyword in ctx.keywords:
+            variants = (keyword.upper(), keyword.lower(), keyword.capitalize())
+            for needle in encode_needles(variants, encoding, warn=encoding != "ascii").values():
+                needles.setdefault(needle, {})[keyword] = None
+    searched = {keyword for keywords in needles.values() for keyword in keywords}
+    zip_data, entries = zip_source(ctx.archive)
+    for entry in entries:
+        first = {}
+        chunks = iter_inflate(zip_data, entry, budget=ctx.inflate_budget)
+        try:
+            for offset, needle in patterns.search_chunks(chunks, list(needles)):
+                for keyword in needles[needle]:
+                    first.setdefault(keyword, offset)
+                if len(first) == len(searched):
+                    break
+        except (zlib.error, ZipError) as e:
+            print(f"  {entry.filename[:64]}: could not inflate ({e})")
+            continue
+        finally:
+            chunks.close()
+        found = ", ".join(f"{k} at {offset}" for k, offset in first.items())
+        print(f"  {entry.filename[:64]}: {found or 'no patterns found'}")
+
+
+@plugin("xmilib", "cross-check with the external xmi-reader package, if installed")
+def xmi_reader(ctx):
+    try:
+        import xmi
+    except ImportError:
+        print("  xmi-reader is not installed (pip install xmi-reader); skipped")
+        return
+    xmi_obj = xmi.open_file(str(ctx.archive.path))
+    xmi_obj.print_details()
+    if xmi_obj.has_message():
+        print(f"Message: {xmi_obj.get_message()}")
+    for f in xmi_obj.get_files():
+        if xmi_obj.is_pds(f):
+            for m in xmi_obj.get_members(f):
+                print(f"  {f}({m})")
+        else:
+            print(f"  {f}")
+    extract_dir = ctx.output("xmi_files")
+    extract_dir.mkdir(exist_ok=True)
+    xmi_obj.set_output_folder(str(extract_dir))
+    xmi_obj.extract_all()
@@ -0,0 +1,220 @@
+"""
+Decode stage: read a transmission once and hand the decoded bytes to every plugin.
+
+Transmissions arrive either base64-wrapped (decoded into memory) or as raw
+binary NETDATA, which is memory-mapped: parsers and searches then run on the
+mapping and its memoryviews without reading the file into the Python heap.
+"""
+
+import binascii
+import io
+import itertools
+import mmap
+from collections.abc import Mapping
+from pathlib import Path
+
+CHUNK_SIZE = 1 << 20
+SNIFF_SIZE = 4096
+WHITESPACE = b" \t\r\n\x0b\x0c"
+BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+INMR01 = "INMR01".encode("cp037")
+
+
+def iter_base64(f, chunk_size=CHUNK_SIZE):
+    """Decode a base64-wrapped stream incrementally, yielding decoded chunks
+
+    Reads `chunk_size` bytes at a time and decodes up to the last complete line
+    with binascii.a2b_base64.  Lines may have any length: whitespace is dropped
+    and the characters past the last full 4-character quantum are carried into
+    the next chunk, so memory stays at about one chunk whatever the file size.
+    """
+    carry = b""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        cut = chunk.rfind(b"\n") + 1
+        if not cut:  # no line end in this chunk (a very long line): decode it all
+            cut = len(chunk)
+        text = (carry + chunk[:cut]).translate(None, WHITESPACE)
+        carry = chunk[cut:]
+        whole = len(text) - len(text) % 4
+        if whole:
+            yield binascii.a2b_base64(text[:whole])
+        carry = text[whole:] + carry
+    text = carry.translate(None, WHITESPACE)
+    if text:
+        yield binascii.a2b_base64(text)
+
+
+def unwrap_base64(content):
+    """Decode the base64 lines of a wrapped transmission held in memory"""
+    return b"".join(iter_base64(io.BytesIO(content)))
+
+
+def sniff(head):
+    """'binary' for raw NETDATA, 'base64' for wrapped text, from the first bytes of a file"""
+    # a raw transmission opens with the INMR01 control segment: length, flags, 'INMR01'
+    if len(head) >= 8 and head[1] & 0xE0 == 0xE0 and head[2:8] == INMR01:
+        return "binary"
+    if head and not head.translate(None, BASE64_ALPHABET + WHITESPACE):
+        return "base64"
+    return "binary"
+
+
+def detect_format(path):
+    with open(path, "rb") as f:
+        return sniff(f.read(SNIFF_SIZE))
+
+
+class Archive:
+    """A decoded XMI/NETDATA transmission shared by all analysis plugins.
+
+    Derived views (the control records, the ZIP entry list) are computed on
+    first use and cached, so running every plugin costs one read and one decode.
+    """
+
+    def __init__(self, path, raw_size, data, encoding):
+        self.path = Path(path)
+        self.raw_size = raw_size
+        self.data = data  # bytes, or an mmap for binary transmissions
+        self.encoding = encoding
+        self._zip_entries = None
+        self._zip_index = False
+        self._datasets = None
+        self._header = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the mapping of a binary transmission"""
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                pass  # a memoryview of it is still alive; the mapping goes with the last one
+
+    @property
+    def view(self):
+        """A memoryview of the decoded buffer; slicing it copies nothing"""
+        return memoryview(self.data)
+
+    @property
+    def zip_entries(self):
+        if self._zip_entries is None:
+            from .zipscan import find_zip_entries
+
+            self._zip_entries = find_zip_entries(self.data)
+        return self._zip_entries
+
+    @property
+    def datasets(self):
+        """The reassembled, unblocked data of each transmitted file, by file number (see Datasets)"""
+        if self._datasets is None:
+            self._datasets = Datasets(self.data)
+        return self._datasets
+
+    @property
+    def zip_index(self):
+        """ZipIndex of the first dataset (or the buffer itself) that is a ZIP archive, else None"""
+        if self._zip_index is False:
+            from .netdata import NetdataError
+            from .zipscan import ZipError, ZipIndex
+
+            try:
+                numbers = list(self.datasets)
+            except NetdataError:
+                numbers = []
+            self._zip_index = None
+            for data in itertools.chain((self.datasets[n] for n in numbers), [self.data]):
+                try:
+                    self._zip_index = ZipIndex(data)
+                    break
+                except ZipError:
+                    continue
+        return self._zip_index
+
+    @property
+    def header(self):
+        """The NETDATA control records (see netdata.Header)"""
+        if self._header is None:
+            from .netdata import read_header
+
+            self._header = read_header(self.data)
+        return self._header
+
+
+class Datasets(Mapping):
+    """The data of each transmitted file, by file number, reassembled only when asked for
+
+    Listing the file numbers takes one pass over the segment stream that keeps
+    no data.  records() hands out a file's Records lazily; looking a file up
+    joins its records into one buffer that is not kept, so only the dataset in
+    use is ever held in memory.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self._numbers = None
+
+    def _file_numbers(self):
+        if self._numbers is None:
+            from .netdata import iter_data_records
+
+            self._numbers = list(dict.fromkeys(rec.file_number for rec in iter_data_records([self.data])))
+        return self._numbers
+
+    def records(self, number):
+        """The unblocked Records of one file, read from the stream as they are consumed"""
+        from .netdata import iter_data_records
+
+        seen = False
+        for rec in iter_data_records([self.data]):
+            if rec.file_number == number:
+                seen = True
+                yield rec
+            elif seen:
+                return  # files are transmitted one after the other
+
+    def __getitem__(self, number):
+        if number not in self._file_numbers():
+            raise KeyError(number)
+        return b"".join(rec.data for rec in self.records(number))
+
+    def __iter__(self):
+        return iter(self._file_numbers())
+
+    def __len__(self):
+        return len(self._file_numbers())
+
+
+def stream(path, chunk_size=CHUNK_SIZE):
+    """Decoded chunks of a transmission in either format, for netdata.iter_records()"""
+    with open(path, "rb") as f:
+        if sniff(f.read(SNIFF_SIZE)) == "base64":
+            f.seek(0)
+            yield from iter_base64(f, chunk_size)
+            return
+        f.seek(0)
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def load(path):
+    """Open a transmission: binary NETDATA is memory-mapped, base64 is decoded"""
+    path = Path(path)
+    size = path.stat().st_size
+    if detect_format(path) == "base64":
+        return Archive(path, size, b"".join(stream(path)), "base64")
+    if not size:
+        return Archive(path, size, b"", "binary")
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return Archive(path, size, data, "binary")
@@ -0,0 +1,320 @@
+"""
+ZIP structures embedded in a decoded transmission.
+
+ZipIndex reads an intact archive the way unzip does, from the end of central
+directory record; find_zip_entries() is the signature scan kept for damaged
+buffers whose central directory cannot be trusted.
+"""
+
+import bz2
+import gzip
+import os
+import queue
+import struct
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+LOCAL_HEADER = struct.Struct("<LHHHHHLLLHH")
+LOCAL_HEADER_SIG = 0x04034B50
+CENTRAL_HEADER = struct.Struct("<LHHHHHHLLLHHHHHLL")
+CENTRAL_HEADER_SIG = 0x02014B50
+EOCD = struct.Struct("<LHHHHLLH")
+EOCD_SIG = b"PK\x05\x06"
+ZIP64_LOCATOR = struct.Struct("<LLQL")
+ZIP64_LOCATOR_SIG = 0x07064B50
+ZIP64_EOCD = struct.Struct("<LQHHLLQQQQ")
+ZIP64_EOCD_SIG = 0x06064B50
+ZIP64_EXTRA_ID = 0x0001
+MAX_COMMENT = 0xFFFF
+FLAG_DATA_DESCRIPTOR = 0x08
+FLAG_UTF8 = 0x800
+
+SIGNATURES = [
+    (b"PK\x03\x04", "Local File Header"),
+    (b"PK\x01\x02", "Central Directory"),
+    (b"PK\x05\x06", "End of Central Directory"),
+    (b"PK\x07\x08", "Data Descriptor"),
+]
+
+ZipEntry = namedtuple(
+    "ZipEntry",
+    "position filename method flags crc32 compressed_size uncompressed_size data_start",
+)
+
+# every recovery attempt the old extractors made, in the order they made them
+DECOMPRESSION_METHODS = [
+    ("Raw deflate", lambda d: zlib.decompress(d, -15)),
+    ("Zlib deflate", lambda d: zlib.decompress(d, 15)),
+    ("Raw deflate (skip 2)", lambda d: zlib.decompress(d[2:], -15)),
+    ("Raw deflate (skip 4)", lambda d: zlib.decompress(d[4:], -15)),
+    ("Gzip", gzip.decompress),
+    ("Bzip2", bz2.decompress),
+    ("Raw deflate (wbits -9)", lambda d: zlib.decompress(d, -9)),
+    ("Raw deflate (wbits -12)", lambda d: zlib.decompress(d, -12)),
+]
+
+
+def find_all_positions(data, pattern):
+    """Find all (possibly overlapping) positions of a pattern in data"""
+    positions = []
+    pos = data.find(pattern)
+    while pos != -1:
+        positions.append(pos)
+        pos = data.find(pattern, pos + 1)
+    return positions
+
+
+def find_zip_entries(data):
+    """Parse every ZIP local file header found in data"""
+    entries = []
+    for pos in find_all_positions(data, b"PK\x03\x04"):
+        if pos + LOCAL_HEADER.size > len(data):
+            break
+        (_sig, _ver, flags, method, _time, _date, crc, comp_size, uncomp_size,
+         name_len, extra_len) = LOCAL_HEADER.unpack_from(data, pos)
+        name_start = pos + LOCAL_HEADER.size
+        filename = data[name_start:name_start + name_len].decode("utf-8", errors="replace")
+        # damaged headers can carry binary "names"; keep them printable for reports
+        filename = "".join(c if c.isprintable() and c != "\ufffd" else "." for c in filename)
+        entries.append(ZipEntry(pos, filename or "unknown", method, flags, crc, comp_size,
+                                uncomp_size, name_start + name_len + extra_len))
+    return entries
+
+
+class ZipError(ValueError):
+    pass
+
+
+def _zip64_extra(extra, values):
+    """Replace the 0xFFFFFFFF fields of `values` (usize, csize, offset) from a ZIP64 extra field"""
+    pos = 0
+    while pos + 4 <= len(extra):
+        tag, size = struct.unpack_from("<HH", extra, pos)
+        if tag == ZIP64_EXTRA_ID:
+            field = pos + 4
+            values = list(values)
+            for i, v in enumerate(values):
+                if v == 0xFFFFFFFF:
+                    if field + 8 > pos + 4 + size:
+                        raise ZipError("truncated ZIP64 extra field")
+                    (values[i],) = struct.unpack_from("<Q", extra, field)
+                    field += 8
+            return values
+        pos += 4 + size
+    return values
+
+
+class ZipIndex:
+    """Member index of a ZIP archive built from its central directory
+
+    Opening reads the EOCD (and the ZIP64 EOCD when present) and one central
+    directory header per member, then checks each member's local header, so the
+    cost is proportional to the member count rather than the archive size.
+    Members are looked up by name in O(1).  Prepended data (a ZIP inside a
+    larger buffer) is allowed for.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.view = memoryview(data)
+        self.entries = {}
+        self.problems = []  # (name, reason) for members whose local header disagrees
+        self.comment = b""
+        self._read_central_directory()
+
+    def _find_eocd(self):
+        tail_start = max(0, len(self.data) - EOCD.size - MAX_COMMENT)
+        pos = self.data.rfind(EOCD_SIG, tail_start)
+        while pos != -1:
+            if pos + EOCD.size <= len(self.data):
+                comment_len = EOCD.unpack_from(self.data, pos)[7]
+                if pos + EOCD.size + comment_len <= len(self.data):
+                    return pos
+            pos = self.data.rfind(EOCD_SIG, tail_start, pos)
+        raise ZipError("no end of central directory record")
+
+    def _read_central_directory(self):
+        eocd = self._find_eocd()
+        (_sig, _disk, _cd_disk, _n_here, count, cd_size, cd_offset,
+         comment_len) = EOCD.unpack_from(self.data, eocd)
+        self.comment = bytes(self.view[eocd + EOCD.size:eocd + EOCD.size + comment_len])
+        end = eocd  # the central directory ends where the (ZIP64) EOCD starts
+        locator = eocd - ZIP64_LOCATOR.size
+        if locator >= 0 and ZIP64_LOCATOR.unpack_from(self.data, locator)[0] == ZIP64_LOCATOR_SIG:
+            _sig, _disk, z64_offset, _disks = ZIP64_LOCATOR.unpack_from(self.data, locator)
+            # the recorded offset is relative to the archive start; the record sits before the locator
+            z64 = locator - ZIP64_EOCD.size
+            if z64 < 0 or ZIP64_EOCD.unpack_from(self.data, z64)[0] != ZIP64_EOCD_SIG:
+                z64 = z64_offset
+            if z64 + ZIP64_EOCD.size > len(self.data) or \
+                    ZIP64_EOCD.unpack_from(self.data, z64)[0] != ZIP64_EOCD_SIG:
+                raise ZipError("ZIP64 locator points to no ZIP64 end of central directory record")
+            (_sig, _size, _made, _need, _disk, _cd_disk, _n_here, count, cd_size,
+             cd_offset) = ZIP64_EOCD.unpack_from(self.data, z64)
+            end = z64
+        cd_start = end - cd_size
+        self.base = cd_start - cd_offset  # bytes in front of the archive
+        if cd_start < 0 or self.base < 0:
+            raise ZipError("central directory lies outside the buffer")
+
+        pos = cd_start
+        for _ in range(count):
+            if pos + CENTRAL_HEADER.size > end:
+                raise ZipError(f"central directory ends early ({len(self.entries)} of {count} members)")
+            (sig, _made, _need, flags, method, _time, _date, crc, comp_size, uncomp_size,
+             name_len, extra_len, comment_len, _disk, _iattr, _eattr,
+             offset) = CENTRAL_HEADER.unpack_from(self.data, pos)
+            if sig != CENTRAL_HEADER_SIG:
+                raise ZipError(f"bad central directory header at {pos}")
+            name_start = pos + CENTRAL_HEADER.size
+            raw_name = bytes(self.view[name_start:name_start + name_len])
+            name = raw_name.decode("utf-8" if flags & FLAG_UTF8 else "cp437")
+            extra = self.view[name_start + name_len:name_start + name_len + extra_len]
+            uncomp_size, comp_size, offset = _zip64_extra(extra, (uncomp_size, comp_size, offset))
+            pos = name_start + name_len + extra_len + comment_len
+            self.entries[name] = self._check_local(
+                name, raw_name, flags, method, crc, comp_size, uncomp_size, self.base + offset)
+
+    def _check_local(self, name, raw_name, flags, method, crc, comp_size, uncomp_size, position):
+        """The member's ZipEntry, with data_start taken from its local header"""
+        if position + LOCAL_HEADER.size > len(self.data):
+            raise ZipError(f"local header of {name} lies outside the buffer")
+        (sig, _ver, _flags, l_method, _time, _date, l_crc, l_comp, _l_uncomp,
+         l_name_len, l_extra_len) = LOCAL_HEADER.unpack_from(self.data, position)
+        name_start = position + LOCAL_HEADER.size
+        if sig != LOCAL_HEADER_SIG:
+            self.problems.append((name, "no local header signature"))
+        elif bytes(self.view[name_start:name_start + l_name_len]) != raw_name:
+            self.problems.append((name, "local header names a different file"))
+        elif l_method != method:
+            self.problems.append((name, f"local method {l_method}, central {method}"))
+        elif not flags & FLAG_DATA_DESCRIPTOR and l_comp != 0xFFFFFFFF and (l_crc, l_comp) != (crc, comp_size):
+            # with a data descriptor the local CRC and sizes are zero; the central ones are used
+            self.problems.append((name, "local CRC/size differ from the central directory"))
+        return ZipEntry(position, name, method, flags, crc, comp_size, uncomp_size,
+                        name_start + l_name_len + l_extra_len)
+
+    def __getitem__(self, name):
+        return self.entries[name]
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __iter__(self):
+        return iter(self.entries.values())
+
+    def __len__(self):
+        return len(self.entries)
+
+    def compressed(self, name):
+        """The compressed bytes of a member, as a memoryview of the buffer"""
+        entry = self.entries[name]
+        return self.view[entry.data_start:entry.data_start + entry.compressed_size]
+
+
+def entry_data(data, entry):
+    """The (still compressed) bytes of an entry, clipped to the buffer"""
+    return data[entry.data_start:entry.data_start + entry.compressed_size]
+
+
+def try_standard_decompression(data, method):
+    """Return (description, output) for the first method that works, else (None, None)"""
+    if method == 0:
+        return "Stored", bytes(data)
+    if method != 8 or not data:
+        return None, None
+    for desc, func in DECOMPRESSION_METHODS:
+        try:
+            return desc, func(data)
+        except Exception:
+            continue
+    return None, None
+
+
+def inflate_entry(data, entry):
+    """A member's content, checked against its CRC32 (stored and deflated members)"""
+    compressed = memoryview(data)[entry.data_start:entry.data_start + entry.compressed_size]
+    if entry.method == 0:
+        output = bytes(compressed)
+    elif entry.method == 8:
+        # the header size is untrusted: it only caps the output (one byte over reveals a
+        # lie), while the buffer grows with what actually inflates
+        inflater = zlib.decompressobj(-15)
+        try:
+            output = inflater.decompress(compressed, entry.uncompressed_size + 1)
+        except zlib.error as e:
+            raise ZipError(f"{entry.filename}: {e}") from None
+    else:
+        raise ZipError(f"{entry.filename}: unsupported compression method {entry.method}")
+    if len(output) > entry.uncompressed_size:
+        raise ZipError(f"{entry.filename}: inflates past the {entry.uncompressed_size:,} bytes in its header")
+    if len(output) < entry.uncompressed_size:
+        raise ZipError(f"{entry.filename}: {len(output):,} bytes, header says {entry.uncompressed_size:,}")
+    if zlib.crc32(output) != entry.crc32:
+        raise ZipError(f"{entry.filename}: CRC32 {zlib.crc32(output):08x}, expected {entry.crc32:08x}")
+    return output
+
+
+def iter_inflate(data, entry, chunk_size=1 << 16, budget=None):
+    """Yield a member's content in chunks of at most chunk_size, without holding all of it
+
+    Built on zlib.decompressobj; stops after `budget` output bytes when given.
+    Closing the generator early stops the inflation.
+    """
+    compressed = memoryview(data)[entry.data_start:entry.data_start + entry.compressed_size]
+    remaining = budget if budget is not None else float("inf")
+    if entry.method == 0:
+        for pos in range(0, len(compressed), chunk_size):
+            if remaining <= 0:
+                return
+            piece = bytes(compressed[pos:pos + min(chunk_size, remaining)])
+            remaining -= len(piece)
+            yield piece
+        return
+    if entry.method != 8:
+        raise ZipError(f"{entry.filename}: unsupported compression method {entry.method}")
+    inflater = zlib.decompressobj(-15)
+    pending = compressed
+    while remaining > 0 and not inflater.eof:
+        piece = inflater.decompress(pending, min(chunk_size, remaining))
+        pending = inflater.unconsumed_tail
+        if not piece:
+            if not pending:
+                return  # input exhausted (truncated member)
+            continue
+        remaining -= len(piece)
+        yield piece
+
+
+def inflate_parallel(data, entries, workers=None, queue_size=None):
+    """Yield (entry, output, error) for each member as it finishes inflating
+
+    Members are inflated by inflate_entry() on a thread pool; zlib and crc32
+    release the GIL, so independent members use separate cores.  Results pass
+    through a queue of `queue_size` slots (default twice the workers), so at
+    most that many inflated members wait for the consumer at any time.
+    """
+    workers = workers or os.cpu_count() or 1
+    results = queue.Queue(queue_size or 2 * workers)
+
+    def work(entry):
+        try:
+            results.put((entry, inflate_entry(data, entry), None))
+        except Exception as e:
+            results.put((entry, None, e))
+
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [pool.submit(work, entry) for entry in entries]
+        try:
+            for _ in futures:
+                yield results.get()
+        finally:
+            # consumer stopped early: drop queued members and unblock the workers
+            for f in futures:
+                f.cancel()
+            while not all(f.done() for f in futures):
+                try:
+                    results.get(timeout=0.05)
+                except queue.Empty:
+                    pass
@@ -0,0 +1,18 @@
+"""HLM1 message decoding as a library.
+
+    import hlm1
+    config = hlm1.DecoderConfig(joiner=' ')
+    for msg in hlm1.decode('patients.pcap', config):
+        print(msg.label(), msg.text)
+
+frame() and decode() accept bytes, a path, a binary file object or any
+iterable of byte chunks, so messages can be decoded in-process straight from
+a socket or queue.  hlm1_decode.py is the command line front end.
+"""
+
+from .config import DEFAULT_CONFIG, HEADER, DecoderConfig
+from .framing import HLM1Framer, decode_messages, frame, frame_valid
+from .pipeline import (Frame, Message, decode, decode_frames, frame_capture, iter_capture,
+                       reservoir_sample, sample_seek, stream_frames)
+from .sinks import AggregateSink, CallbackSink, PrettySink, ReassembledSink, Sink, TextSink, TokenDumpSink
+from .tokens import TokenView, assemble, make_pretty, process_message, process_message_lazy
@@ -0,0 +1,191 @@
+# Streaming per-window counters over decoded HL7 messages.
+#
+# Time is cut into slices of `slide` seconds.  Each slice holds Counters by
+# message type (MSH-9), sending facility (MSH-4) and patient (PID-3), plus an
+# optional HyperLogLog sketch of distinct patients.  A window is the last
+# window/slide slices: with slide == window that is a tumbling window, with a
+# smaller slide a sliding one.  Whenever a slice closes the window ending there
+# is written as one JSON line, so memory depends on the number of distinct keys
+# in a window, never on how many messages went through.
+#
+# A message is placed by its capture timestamp, else its MSH-7.  One with neither
+# takes the time of the message before it; those seen before any timestamp are
+# written at the end as a single 'undated' record.
+
+import json, math, re
+from collections import Counter, deque
+from datetime import datetime, timezone
+from hashlib import blake2b
+
+HLL_BITS = 10   # 1024 registers, ~3% standard error
+UNKNOWN = '?'
+
+def hl7_summary(text):
+    # (message type, sending facility, patient id, MSH-7 timestamp or None) from one
+    # reassembled message; fields that cannot be found come back as UNKNOWN
+    mtype = facility = patient = UNKNOWN
+    sent = None
+    msh = text.find('MSH')
+    if msh != -1 and len(text) > msh + 3:
+        fsep = text[msh + 3]
+        seg = re.split(r'[\r\n]', text[msh:], maxsplit=1)[0].split(fsep)
+        # seg[0] is 'MSH' and MSH-1 is the separator itself, so seg[n-1] is MSH-n
+        if len(seg) > 3 and seg[3]:
+            facility = seg[3].split('^')[0]
+        if len(seg) > 6:
+            sent = parse_hl7_time(seg[6])
+        if len(seg) > 8 and seg[8]:
+            mtype = '^'.join(seg[8].split('^')[:2])
+        pid = text.find('PID' + fsep, msh)
+        if pid != -1:
+            fields = re.split(r'[\r\n]', text[pid:], maxsplit=1)[0].split(fsep)
+            if len(fields) > 3 and fields[3]:
+                patient = fields[3].split('^')[0]
+    return mtype, facility, patient, sent
+
+def parse_hl7_time(value):
+    digits = re.match(r'\d{8,14}', value or '')
+    if not digits:
+        return None
+    d = digits.group().ljust(14, '0')
+    try:
+        return datetime.strptime(d, '%Y%m%d%H%M%S').replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+class HyperLogLog:
+    def __init__(self, bits=HLL_BITS):
+        self.bits = bits
+        self.registers = bytearray(1 << bits)
+
+    def add(self, value):
+        h = int.from_bytes(blake2b(value.encode('utf-8', 'replace'), digest_size=8).digest(), 'big')
+        idx = h >> (64 - self.bits)
+        rest = h & ((1 << (64 - self.bits)) - 1)
+        rank = (64 - self.bits) - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def merge(self, other):
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        est = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if est <= 2.5 * m and zeros:
+            est = m * math.log(m / zeros)  # linear counting for small cardinalities
+        return round(est)
+
+class Slice:
+    def __init__(self, distinct):
+        self.messages = 0
+        self.by_type = Counter()
+        self.by_facility = Counter()
+        self.by_patient = Counter()
+        self.hll = HyperLogLog() if distinct else None
+
+    def add(self, mtype, facility, patient):
+        self.messages += 1
+        self.by_type[mtype] += 1
+        self.by_facility[facility] += 1
+        self.by_patient[patient] += 1
+        if self.hll is not None and patient != UNKNOWN:
+            self.hll.add(patient)
+
+def window_slices(window, slide=None):
+    # number of slide-long slices in a window; float seconds make window % slide unreliable
+    # (1 % 0.1 == 0.0999...), so the ratio only has to be close to a whole number
+    slide = slide or window
+    if window <= 0 or slide <= 0:
+        raise ValueError('window and slide must be positive')
+    ratio = window / slide
+    if ratio < 1 or not math.isclose(ratio, round(ratio), rel_tol=1e-9, abs_tol=1e-9):
+        raise ValueError(f'window ({window:g}s) must be a multiple of slide ({slide:g}s)')
+    return round(ratio)
+
+class WindowAggregator:
+    # expects messages in timestamp order; anything older than the open slice counts as late
+    def __init__(self, out, window=60, slide=None, distinct=False):
+        slide = slide or window
+        count = window_slices(window, slide)
+        self.out = out
+        self.window = window
+        self.slide = slide
+        self.distinct = distinct
+        self.kind = 'tumbling' if slide == window else 'sliding'
+        self.slices = deque(maxlen=count)
+        self.current = None        # index of the open slice
+        self.open = Slice(distinct)
+        self.late = 0              # messages older than the open slice (already emitted)
+        self.undated = Slice(distinct)  # messages with no time at all, before any dated one
+        self.last_ts = None        # event time of the latest message
+        self.emitted = 0
+
+    def add(self, text, ts=None):
+        mtype, facility, patient, sent = hl7_summary(text)
+        if ts is None:
+            # an undated message belongs with its neighbours in the stream; the wall clock
+            # would push the windows to now and make every later dated message late
+            ts = sent if sent is not None else self.last_ts
+            if ts is None:
+                self.undated.add(mtype, facility, patient)
+                return
+        self.last_ts = ts
+        idx = int(ts // self.slide)
+        if self.current is None:
+            self.current = idx
+        if idx < self.current:
+            self.late += 1
+            return
+        self._advance(idx)
+        self.open.add(mtype, facility, patient)
+
+    def _advance(self, idx):
+        while self.current < idx:
+            self.slices.append(self.open)
+            self._emit((self.current + 1) * self.slide)
+            self.open = Slice(self.distinct)
+            self.current += 1
+            if not any(s.messages for s in self.slices):
+                # idle gap: nothing left to report until idx, jump straight there
+                self.slices.clear()
+                self.current = idx
+
+    def _emit(self, end):
+        live = [s for s in self.slices if s.messages]
+        if live:
+            self._write({'window': self.kind, 'start': _iso(end - self.window), 'end': _iso(end)}, live)
+
+    def _write(self, rec, live):
+        by_type, by_facility, by_patient = Counter(), Counter(), Counter()
+        hll = HyperLogLog() if self.distinct else None
+        for s in live:
+            by_type.update(s.by_type)
+            by_facility.update(s.by_facility)
+            by_patient.update(s.by_patient)
+            if hll is not None:
+                hll.merge(s.hll)
+        rec.update({
+            'messages': sum(s.messages for s in live),
+            'by_type': dict(by_type),
+            'by_facility': dict(by_facility),
+            'by_patient': dict(by_patient),
+        })
+        if hll is not None:
+            rec['distinct_patients'] = hll.estimate()
+        self.out.write(json.dumps(rec) + '\n')
+        self.out.flush()
+        self.emitted += 1
+
+    def close(self):
+        # flush the open slice and every sliding window that still overlaps data, then the
+        # messages that came before any timestamp as one record of their own
+        if self.current is not None:
+            self._advance(self.current + self.slices.maxlen)
+        if self.undated.messages:
+            self._write({'window': 'undated'}, [self.undated])
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
@@ -0,0 +1,90 @@
+# On-disk cache of decoded HLM1 messages.
+#
+# Entries are keyed by a blake2b hash of the framed message plus the decoder
+# settings that affect its output, so re-running over the same (or an
+# overlapping) capture skips process_message() for everything already seen.
+# Changing SEP / JOINER / STRIP_NONPRINT simply produces different keys.
+# The store is a single sqlite file; once it grows past max_bytes the least
+# recently used entries are evicted.
+
+import json, sqlite3, time
+from hashlib import blake2b
+from pathlib import Path
+
+CACHE_VERSION = 1                    # bump when process_message() output changes
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+class DecodeCache:
+    def __init__(self, path, settings, max_bytes=DEFAULT_MAX_BYTES):
+        path = Path(path)
+        if path.suffix != '.sqlite':
+            # treat a plain path as a cache directory
+            path.mkdir(parents=True, exist_ok=True)
+            path = path / 'hlm1_cache.sqlite'
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._salt = repr((CACHE_VERSION,) + tuple(settings)).encode('utf-8')
+        self._db = sqlite3.connect(str(path))
+        self._db.execute('CREATE TABLE IF NOT EXISTS entries ('
+                         'key BLOB PRIMARY KEY, value BLOB NOT NULL, '
+                         'size INTEGER NOT NULL, atime REAL NOT NULL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS entries_atime ON entries (atime)')
+        self._touched = {}
+
+    def key(self, block):
+        h = blake2b(self._salt, digest_size=16)
+        h.update(block)
+        return h.digest()
+
+    def get(self, block):
+        k = self.key(block)
+        row = self._db.execute('SELECT value FROM entries WHERE key = ?', (k,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # access times are written back in one batch on close()
+        self._touched[k] = time.time()
+        return json.loads(row[0])
+
+    def put(self, block, tokens):
+        value = json.dumps(tokens, ensure_ascii=False).encode('utf-8')
+        self._db.execute('INSERT OR REPLACE INTO entries (key, value, size, atime) VALUES (?, ?, ?, ?)',
+                         (self.key(block), value, len(value), time.time()))
+
+    def size(self):
+        return self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def evict(self):
+        # drop least recently used entries until we are back under budget
+        excess = self.size() - self.max_bytes
+        if excess <= 0:
+            return 0
+        dropped = 0
+        rows = self._db.execute('SELECT key, size FROM entries ORDER BY atime')
+        victims = []
+        for k, sz in rows:
+            if excess <= 0:
+                break
+            victims.append((k,))
+            excess -= sz
+            dropped += 1
+        self._db.executemany('DELETE FROM entries WHERE key = ?', victims)
+        return dropped
+
+    def close(self):
+        if self._touched:
+            self._db.executemany('UPDATE entries SET atime = ? WHERE key = ?',
+                                 [(t, k) for k, t in self._touched.items()])
+            self._touched.clear()
+        self.evict()
+        self._db.commit()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,35 @@
+# Decoder configuration.  Everything that used to be a module global in
+# hlm1_decode.py lives here, so several decoders with different settings can
+# run side by side in one process (and be shipped to worker processes).
+
+import struct
+from collections import namedtuple
+
+# observed frame header: MAGIC, sequence number, message type, payload length and a
+# CRC-16/CCITT-FALSE of the payload (all big endian)
+HEADER = struct.Struct('>4sBBHH')
+
+_FIELDS = (
+    ('sep', b'\xaa'),             # observed separator between chunks
+    ('magic', b'HLM1'),           # observed message header
+    ('joiner', ''),               # how to join reversed tokens when producing reassembled text
+    ('strip_nonprint', True),     # remove stray non-printable characters from token ends for readability
+    ('max_payload', 16384),       # longest payload we believe; anything larger is a corrupt header
+    ('verify_crc', True),         # reject frames whose payload does not match the header CRC
+    ('resync_lookahead', 65536),  # bytes scanned per step when hunting for the next MAGIC after corruption
+)
+
+class DecoderConfig(namedtuple('DecoderConfig', [f for f, _ in _FIELDS], defaults=[d for _, d in _FIELDS])):
+    # immutable; derive variants with config._replace(joiner=' ')
+    __slots__ = ()
+
+    def cache_settings(self):
+        # the fields that change decoded output; part of every cache key
+        return (self.sep, self.magic, self.joiner, self.strip_nonprint)
+
+    @property
+    def sample_window(self):
+        # bytes read at each sampled offset; always holds one whole frame
+        return 2 * (HEADER.size + self.max_payload)
+
+DEFAULT_CONFIG = DecoderConfig()
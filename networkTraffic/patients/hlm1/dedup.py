@@ -0,0 +1,121 @@
+# Duplicate suppression for retransmitted HLM1 messages.
+#
+# Each framed message (header + payload) is reduced to a 64-bit blake2b
+# fingerprint.  Fingerprints are remembered either in a bounded LRU window
+# (exact, optionally also bounded in time when packet timestamps are known)
+# or in a pair of rotating Bloom filters for very large windows, where a small
+# false-positive rate is acceptable in exchange for ~1-2 bytes per message.
+
+import math
+from collections import OrderedDict
+from hashlib import blake2b
+
+DEFAULT_WINDOW = 65536
+
+def message_fingerprint(block):
+    return blake2b(block, digest_size=8).digest()
+
+class LRUWindow:
+    # remembers the last `size` fingerprints; with `seconds` set, entries older
+    # than that (relative to the newest timestamp seen) no longer count as duplicates
+    def __init__(self, size=DEFAULT_WINDOW, seconds=None):
+        self.size = size
+        self.seconds = seconds
+        self._seen = OrderedDict()
+
+    def check_and_add(self, fp, ts=None):
+        seen = self._seen
+        dup = False
+        if fp in seen:
+            prev = seen[fp]
+            dup = self.seconds is None or ts is None or prev is None or ts - prev <= self.seconds
+        seen[fp] = ts
+        seen.move_to_end(fp)
+        if len(seen) > self.size:
+            seen.popitem(last=False)
+        if self.seconds is not None and ts is not None:
+            # age out from the old end; stops at the first entry still inside the window
+            while seen:
+                k = next(iter(seen))
+                t = seen[k]
+                if t is None or ts - t <= self.seconds:
+                    break
+                del seen[k]
+        return dup
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.001):
+        nbits = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.nbits = nbits
+        self.nhashes = max(1, round(nbits / capacity * math.log(2)))
+        self.bits = bytearray((nbits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, fp):
+        # double hashing (Kirsch-Mitzenmacher) from the 64-bit fingerprint
+        h1 = int.from_bytes(fp[:4], 'little')
+        h2 = int.from_bytes(fp[4:8], 'little') | 1
+        n = self.nbits
+        return [(h1 + i * h2) % n for i in range(self.nhashes)]
+
+    def __contains__(self, fp):
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(fp))
+
+    def add(self, fp):
+        bits = self.bits
+        for p in self._positions(fp):
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+class RotatingBloom:
+    # two generations of `size` fingerprints each: memory stays fixed and the
+    # effective window is between size and 2*size messages.  With `seconds` set a
+    # generation also rotates once it spans more than that, so copies up to `seconds`
+    # apart are always caught and copies more than 3*seconds apart never are
+    def __init__(self, size=DEFAULT_WINDOW, error_rate=0.001, seconds=None):
+        self.size = size
+        self.error_rate = error_rate
+        self.seconds = seconds
+        self._current = BloomFilter(size, error_rate)
+        self._previous = None
+        self._started = None   # timestamp of the first message in the current generation
+
+    def _rotate(self, ts, keep=True):
+        self._previous = self._current if keep else None
+        self._current = BloomFilter(self.size, self.error_rate)
+        self._started = ts
+
+    def check_and_add(self, fp, ts=None):
+        if self.seconds is not None and ts is not None:
+            if self._started is None:
+                self._started = ts
+            elif ts - self._started > self.seconds:
+                # after a long gap the current generation is too old to keep as well
+                self._rotate(ts, keep=ts - self._started <= 2 * self.seconds)
+        dup = fp in self._current or (self._previous is not None and fp in self._previous)
+        if not dup:
+            if self._current.count >= self.size:
+                self._rotate(ts)
+            self._current.add(fp)
+        return dup
+
+class Deduplicator:
+    def __init__(self, window=DEFAULT_WINDOW, seconds=None, bloom=False):
+        self.window = RotatingBloom(window, seconds=seconds) if bloom else LRUWindow(window, seconds)
+        self.total = 0
+        self.duplicates = 0
+
+    def is_duplicate(self, block, ts=None):
+        self.total += 1
+        if self.window.check_and_add(message_fingerprint(block), ts):
+            self.duplicates += 1
+            return True
+        return False
+
+    @property
+    def rate(self):
+        return self.duplicates / self.total if self.total else 0.0
+
+    def report(self):
+        return f'{self.duplicates} of {self.total} messages were duplicates ({self.rate:.1%})'
@@ -0,0 +1,130 @@
+# Splitting a byte stream into HLM1 frames.
+#
+# Frames are cut by the payload length in their header and validated (length
+# bound, CRC), so a damaged MAGIC or length costs only the bytes skipped while
+# resynchronizing instead of merging two messages into one block.
+
+import binascii, os
+
+from .config import DEFAULT_CONFIG, HEADER
+
+READ_CHUNK = 1 << 20   # bytes per read when streaming from a file
+
+def frame_valid(buf, pos, final, config=DEFAULT_CONFIG):
+    # length of the frame at buf[pos] (which starts with MAGIC) if it checks out,
+    # 0 if it is corrupt, None if more data is needed to tell
+    if len(buf) - pos < HEADER.size:
+        return 0 if final else None
+    _magic, _seq, _mtype, length, crc = HEADER.unpack_from(buf, pos)
+    if length > config.max_payload:
+        return 0
+    end = pos + HEADER.size + length
+    if end > len(buf):
+        return 0 if final else None
+    if config.verify_crc and binascii.crc_hqx(buf[pos + HEADER.size:end], 0xffff) != crc:
+        return 0
+    return end - pos
+
+class HLM1Framer:
+    # feed() arbitrary chunks of one byte stream and get back (ts, block) for every complete
+    # message, where ts is the timestamp of the chunk the message started in; flush() at end
+    # of stream.  Each frame must pass frame_valid(); otherwise we resync on the next MAGIC
+    # whose header is plausible, looking at most config.resync_lookahead bytes ahead at a time.
+    def __init__(self, config=DEFAULT_CONFIG):
+        self.config = config
+        self.buf = bytearray()
+        self.start_ts = None
+        self.frames = 0
+        self.bad = 0        # frames rejected by header / CRC validation
+        self.skipped = 0    # bytes thrown away while resynchronizing
+
+    def _resync(self, buf, pos):
+        # next plausible frame start at or after pos, or -1 (caller drops the window)
+        magic = self.config.magic
+        limit = min(len(buf), pos + self.config.resync_lookahead)
+        while True:
+            nxt = buf.find(magic, pos, limit + len(magic) - 1)
+            if nxt == -1:
+                return -1
+            if len(buf) - nxt < HEADER.size or HEADER.unpack_from(buf, nxt)[3] <= self.config.max_payload:
+                return nxt
+            pos = nxt + 1
+
+    def _frame(self, final, ts, residual):
+        # frames starting before `residual` began in an earlier chunk (self.start_ts)
+        buf = self.buf
+        magic = self.config.magic
+        lookahead = self.config.resync_lookahead
+        out = []
+        pos = 0
+        while pos < len(buf):
+            if not buf.startswith(magic, pos):
+                nxt = self._resync(buf, pos)
+                if nxt == -1:
+                    window_end = min(len(buf), pos + lookahead)
+                    if window_end == len(buf) and not final:
+                        # keep a possible partial MAGIC at the tail for the next chunk
+                        tail = max(pos, len(buf) - len(magic) + 1)
+                        self.skipped += tail - pos
+                        pos = tail
+                        break
+                    self.skipped += window_end - pos
+                    pos = window_end
+                    continue
+                self.skipped += nxt - pos
+                pos = nxt
+            n = frame_valid(buf, pos, final, self.config)
+            if n is None:
+                break
+            if n == 0:
+                self.bad += 1
+                self.skipped += 1
+                pos += 1
+                continue
+            out.append((self.start_ts if pos < residual else ts, bytes(buf[pos:pos + n])))
+            self.frames += 1
+            pos += n
+        if final:
+            self.skipped += len(buf) - pos
+            pos = len(buf)
+        elif pos >= residual:
+            self.start_ts = ts
+        del buf[:pos]
+        return out
+
+    def feed(self, data, ts=None):
+        residual = len(self.buf)
+        self.buf += data
+        return self._frame(False, ts, residual)
+
+    def flush(self):
+        return self._frame(True, self.start_ts, len(self.buf))
+
+    def stats(self):
+        return {'frames': self.frames, 'bad': self.bad, 'skipped': self.skipped}
+
+def iter_chunks(source, chunk=READ_CHUNK):
+    # bytes-like chunks from any of the sources frame() accepts
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield source
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from iter(lambda: f.read(chunk), b'')
+    elif hasattr(source, 'read'):
+        yield from iter(lambda: source.read(chunk), b'')
+    else:
+        yield from source  # any iterable of bytes-like chunks (socket reads, queue, ...)
+
+def frame(source, config=DEFAULT_CONFIG, framer=None, chunk=READ_CHUNK):
+    # yields every valid frame (bytes, MAGIC included) from a bytes-like object, a path,
+    # a binary file object or an iterable of chunks, with bounded memory.  Pass your own
+    # framer to read its stats() afterwards.
+    framer = framer if framer is not None else HLM1Framer(config)
+    for data in iter_chunks(source, chunk):
+        for _ts, blk in framer.feed(data):
+            yield blk
+    for _ts, blk in framer.flush():
+        yield blk
+
+def decode_messages(data, config=DEFAULT_CONFIG):
+    return list(frame(data, config))
@@ -0,0 +1,208 @@
+# Minimal capture reader for the HLM1 pipeline: walks a libpcap or pcapng file,
+# peels off the link / IP / transport headers and yields one Packet per TCP or
+# UDP segment, tagged with its directional 5-tuple so callers can keep separate
+# framing state per conversation.  Several captures of the same feed (one per
+# tap) can be merged into a single time-ordered packet stream with
+# merge_packets().  Only the standard library is used.
+
+import heapq, socket, struct
+from collections import namedtuple
+
+PCAP_MAGICS = {
+    b'\xd4\xc3\xb2\xa1': ('<', 1e-6),   # little endian, microsecond timestamps
+    b'\xa1\xb2\xc3\xd4': ('>', 1e-6),
+    b'\x4d\x3c\xb2\xa1': ('<', 1e-9),   # nanosecond variant
+    b'\xa1\xb2\x3c\x4d': ('>', 1e-9),
+}
+
+PCAPNG_SHB = b'\x0a\x0d\x0d\x0a'
+PCAPNG_SHB_TYPE = 0x0a0d0d0a   # same value in either byte order
+PCAPNG_IDB, PCAPNG_PB, PCAPNG_SPB, PCAPNG_EPB = 1, 2, 3, 6
+IF_TSRESOL = 9
+
+READ_BUFFER = 1 << 20   # per-file read buffer when merging many captures
+
+LINKTYPE_NULL = 0
+LINKTYPE_ETHERNET = 1
+LINKTYPE_RAW = 101
+LINKTYPE_LINUX_SLL = 113
+
+IPPROTO_TCP = 6
+IPPROTO_UDP = 17
+
+TCP_FIN, TCP_SYN, TCP_RST = 0x01, 0x02, 0x04
+
+FlowKey = namedtuple('FlowKey', 'proto src sport dst dport')
+Packet = namedtuple('Packet', 'ts key payload seq flags')
+
+def format_flow(key):
+    proto = {IPPROTO_TCP: 'tcp', IPPROTO_UDP: 'udp'}.get(key.proto, str(key.proto))
+    return f'{proto} {key.src}:{key.sport} -> {key.dst}:{key.dport}'
+
+def is_capture(path):
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    return magic in PCAP_MAGICS or magic == PCAPNG_SHB
+
+def read_records(f):
+    # yields (timestamp, linktype, frame bytes) for every record in a pcap or pcapng stream
+    magic = f.read(4)
+    if magic == PCAPNG_SHB:
+        yield from _read_pcapng(f)
+        return
+    hdr = magic + f.read(20)
+    if len(hdr) < 24 or magic not in PCAP_MAGICS:
+        raise ValueError('not a pcap or pcapng file')
+    endian, tick = PCAP_MAGICS[magic]
+    linktype = struct.unpack(endian + 'I', hdr[20:24])[0] & 0x0fffffff
+    rec = struct.Struct(endian + 'IIII')
+    while True:
+        rh = f.read(16)
+        if len(rh) < 16:
+            return
+        sec, frac, incl, _orig = rec.unpack(rh)
+        frame = f.read(incl)
+        if len(frame) < incl:
+            return  # truncated capture
+        yield sec + frac * tick, linktype, frame
+
+def _tsresol(opts, endian):
+    # if_tsresol option of an interface description block; default is microseconds
+    off = 0
+    while off + 4 <= len(opts):
+        code, length = struct.unpack_from(endian + 'HH', opts, off)
+        if code == 0:
+            break
+        if code == IF_TSRESOL and length >= 1:
+            v = opts[off + 4]
+            return 2.0 ** -(v & 0x7f) if v & 0x80 else 10.0 ** -v
+        off += 4 + ((length + 3) & ~3)
+    return 1e-6
+
+def _read_pcapng(f):
+    # called with the first section header block type already consumed
+    endian = '<'
+    interfaces = []
+    btype = PCAPNG_SHB_TYPE
+    while True:
+        head = f.read(4)
+        if len(head) < 4:
+            return
+        if btype == PCAPNG_SHB_TYPE:
+            # the byte-order magic follows the block length, so read it before decoding the length
+            bom = f.read(4)
+            endian = '<' if bom == b'\x4d\x3c\x2b\x1a' else '>'
+            blen = struct.unpack(endian + 'I', head)[0]
+            body = bom + f.read(blen - 12)
+            interfaces = []  # interface ids restart in every section
+        else:
+            blen = struct.unpack(endian + 'I', head)[0]
+            body = f.read(blen - 8)
+        if len(body) < blen - 8:
+            return  # truncated capture
+        if btype == PCAPNG_IDB:
+            linktype = struct.unpack_from(endian + 'H', body, 0)[0]
+            interfaces.append((linktype, _tsresol(body[8:-4], endian)))
+        elif btype == PCAPNG_EPB and interfaces:
+            ifid, hi, lo, caplen, _orig = struct.unpack_from(endian + 'IIIII', body, 0)
+            linktype, tick = interfaces[ifid]
+            yield ((hi << 32) | lo) * tick, linktype, body[20:20 + caplen]
+        elif btype == PCAPNG_PB and interfaces:
+            ifid, _drops, hi, lo, caplen, _orig = struct.unpack_from(endian + 'HHIIII', body, 0)
+            linktype, tick = interfaces[ifid]
+            yield ((hi << 32) | lo) * tick, linktype, body[20:20 + caplen]
+        elif btype == PCAPNG_SPB and interfaces:
+            # simple packet blocks carry no timestamp; they sort first when merging
+            orig = struct.unpack_from(endian + 'I', body, 0)[0]
+            yield 0.0, interfaces[0][0], body[4:4 + min(orig, len(body) - 8)]
+        nxt = f.read(4)
+        if len(nxt) < 4:
+            return
+        btype = struct.unpack(endian + 'I', nxt)[0]
+
+def _network_layer(linktype, frame):
+    # returns (ethertype, offset of the IP header) or None
+    if linktype == LINKTYPE_ETHERNET:
+        off = 12
+        etype = struct.unpack_from('!H', frame, off)[0]
+        while etype in (0x8100, 0x88a8):  # VLAN tags
+            off += 4
+            etype = struct.unpack_from('!H', frame, off)[0]
+        return etype, off + 2
+    if linktype == LINKTYPE_LINUX_SLL:
+        return struct.unpack_from('!H', frame, 14)[0], 16
+    if linktype == LINKTYPE_RAW:
+        return (0x86dd if frame[0] >> 4 == 6 else 0x0800), 0
+    if linktype == LINKTYPE_NULL:
+        family = struct.unpack_from('=I', frame, 0)[0]
+        return (0x0800 if family == socket.AF_INET else 0x86dd), 4
+    return None
+
+def parse_frame(ts, linktype, frame):
+    try:
+        nl = _network_layer(linktype, frame)
+        if nl is None:
+            return None
+        etype, off = nl
+        if etype == 0x0800:
+            ihl = (frame[off] & 0x0f) * 4
+            total = struct.unpack_from('!H', frame, off + 2)[0]
+            if struct.unpack_from('!H', frame, off + 6)[0] & 0x1fff:
+                return None  # non-first fragment, no transport header
+            proto = frame[off + 9]
+            src = socket.inet_ntop(socket.AF_INET, frame[off + 12:off + 16])
+            dst = socket.inet_ntop(socket.AF_INET, frame[off + 16:off + 20])
+            end = off + total if total else len(frame)
+            off += ihl
+        elif etype == 0x86dd:
+            plen = struct.unpack_from('!H', frame, off + 4)[0]
+            proto = frame[off + 6]
+            src = socket.inet_ntop(socket.AF_INET6, frame[off + 8:off + 24])
+            dst = socket.inet_ntop(socket.AF_INET6, frame[off + 24:off + 40])
+            off += 40
+            end = off + plen
+        else:
+            return None
+        end = min(end, len(frame))  # ethernet padding / snaplen
+        if proto == IPPROTO_UDP:
+            sport, dport = struct.unpack_from('!HH', frame, off)
+            return Packet(ts, FlowKey(proto, src, sport, dst, dport), frame[off + 8:end], None, 0)
+        if proto == IPPROTO_TCP:
+            sport, dport, seq = struct.unpack_from('!HHI', frame, off)
+            doff = (frame[off + 12] >> 4) * 4
+            flags = frame[off + 13]
+            return Packet(ts, FlowKey(proto, src, sport, dst, dport), frame[off + doff:end], seq, flags)
+    except (IndexError, struct.error, ValueError):
+        pass  # truncated / malformed headers
+    return None
+
+def read_packets(path, buffering=-1):
+    with open(path, 'rb', buffering=buffering) as f:
+        for ts, linktype, frame in read_records(f):
+            pkt = parse_frame(ts, linktype, frame)
+            if pkt is not None:
+                yield pkt
+
+def merge_packets(paths):
+    # heap-based k-way merge on record timestamps; each capture is assumed to be in
+    # time order already and is read lazily through its own buffer
+    streams = [read_packets(p, READ_BUFFER) for p in paths]
+    return heapq.merge(*streams, key=lambda pkt: pkt.ts)
+
+class FlowTable:
+    # keeps one state object per directional 5-tuple, created on first sight
+    def __init__(self, factory):
+        self.factory = factory
+        self.flows = {}
+
+    def get(self, key):
+        state = self.flows.get(key)
+        if state is None:
+            state = self.flows[key] = self.factory(key)
+        return state
+
+    def __iter__(self):
+        return iter(self.flows.items())
+
+    def __len__(self):
+        return len(self.flows)
@@ -0,0 +1,209 @@
+# From input to decoded messages: capture demultiplexing, sampling and
+# (optionally parallel, optionally cached) token decoding.
+
+import os
+from collections import namedtuple
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+
+from .config import DEFAULT_CONFIG
+from .framing import HLM1Framer, READ_CHUNK, iter_chunks
+from .pcap import IPPROTO_TCP, FlowTable, format_flow, is_capture, read_packets
+from .tcp import TCPStream
+from .tokens import assemble, process_message, process_message_lazy
+
+BATCH = 256   # messages per worker task when the input has no flows to split on
+SAMPLE_DRAWS = 16  # random offsets drawn per requested message before sample_seek() gives up
+
+# one framed message; flow/ts are None for plain binary input
+Frame = namedtuple('Frame', 'flow ts block')
+
+class Message:
+    # one decoded message as handed to sinks.  `tokens` is a list from process_message() or a
+    # lazy TokenView; `text` is the reassembled message, computed on first use and replaceable
+    # by later stages (e.g. redaction)
+    __slots__ = ('index', 'flow', 'ts', 'block', 'tokens', 'config', '_text')
+
+    def __init__(self, index, frame, tokens, config=DEFAULT_CONFIG):
+        self.index = index
+        self.flow, self.ts, self.block = frame
+        self.tokens = tokens
+        self.config = config
+        self._text = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = assemble(self.tokens, self.config)
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+
+    def label(self):
+        if self.flow is None:
+            return f'-- MESSAGE {self.index} --'
+        return f'-- MESSAGE {self.index} [{format_flow(self.flow)}] --'
+
+class FlowDecoder:
+    # framing state for one direction of one conversation; TCP payloads go through
+    # a reassembler first so the framer only ever sees the ordered byte stream
+    def __init__(self, key, config=DEFAULT_CONFIG):
+        self.key = key
+        self.framer = HLM1Framer(config)
+        self.stream = TCPStream() if key.proto == IPPROTO_TCP else None
+        self.frames = []
+
+    def feed(self, pkt):
+        data = pkt.payload
+        if self.stream is not None:
+            was_closed = self.stream.closed
+            data = self.stream.segment(pkt.seq, pkt.flags, data)
+            if self.stream.closed and not was_closed:
+                self._emit(self.framer.feed(data, pkt.ts))
+                self._emit(self.framer.flush())
+                return
+        if data:
+            self._emit(self.framer.feed(data, pkt.ts))
+
+    def close(self):
+        self._emit(self.framer.flush())
+
+    def _emit(self, framed):
+        for ts, blk in framed:
+            self.frames.append(Frame(self.key, ts, blk))
+
+def iter_capture(packets, config=DEFAULT_CONFIG, stats=None):
+    # demultiplex packets by 5-tuple so interleaved senders never share a framer, yielding
+    # frames as soon as their flow completes them; only in-flight bytes are kept per flow.
+    # `stats`, if given, is filled with the flow / TCP reassembly counters once packets run out
+    table = FlowTable(lambda key: FlowDecoder(key, config))
+    count = 0
+    for pkt in packets:
+        if pkt.payload or pkt.key.proto == IPPROTO_TCP:
+            flow = table.get(pkt.key)
+            flow.feed(pkt)
+            if flow.frames:
+                count += len(flow.frames)
+                yield from flow.frames
+                flow.frames.clear()
+    totals = {'flows': len(table), 'frames': 0, 'tcp_streams': 0, 'delivered': 0, 'overlap': 0,
+              'dropped': 0, 'bad': 0, 'skipped': 0}
+    for _key, flow in table:
+        flow.close()
+        count += len(flow.frames)
+        yield from flow.frames
+        flow.frames.clear()
+        framing = flow.framer.stats()
+        totals['bad'] += framing['bad']
+        totals['skipped'] += framing['skipped']
+        if flow.stream is not None:
+            totals['tcp_streams'] += 1
+            for k, v in flow.stream.stats().items():
+                totals[k] += v
+    totals['frames'] = count
+    if stats is not None:
+        stats.update(totals)
+
+def frame_capture(packets, config=DEFAULT_CONFIG):
+    # all frames of a capture in timestamp order plus the counters from iter_capture(); a flow's
+    # last frame only comes out when the flow is flushed, so emission order is not time order
+    stats = {}
+    frames = sorted(iter_capture(packets, config, stats), key=attrgetter('ts'))
+    return frames, stats
+
+def stream_frames(source, config=DEFAULT_CONFIG, framer=None, chunk=READ_CHUNK):
+    # like framing.frame() but yields Frame tuples carrying the chunk timestamp
+    framer = framer if framer is not None else HLM1Framer(config)
+    for data in iter_chunks(source, chunk):
+        for ts, blk in framer.feed(data):
+            yield Frame(None, ts, blk)
+    for ts, blk in framer.flush():
+        yield Frame(None, ts, blk)
+
+def reservoir_sample(items, n, rng):
+    # uniform sample of n items from a stream of unknown length (Algorithm R), in stream order
+    sample = []
+    for i, item in enumerate(items):
+        if i < n:
+            sample.append((i, item))
+        else:
+            j = rng.randrange(i + 1)
+            if j < n:
+                sample[j] = (i, item)
+    return [item for _i, item in sorted(sample, key=lambda s: s[0])]
+
+def sample_seek(path, n, mode, rng, config=DEFAULT_CONFIG):
+    # quick look at a huge binary capture: seek to n evenly spaced or random offsets,
+    # resync on the next valid frame after each one and keep only that message.  Offsets
+    # that land in a message already taken are drawn again in random mode, until n distinct
+    # messages are found or SAMPLE_DRAWS * n draws are spent (a capture with fewer messages);
+    # in even mode n is an upper bound
+    size = os.path.getsize(path)
+    if not size:
+        return []
+    found = {}   # file offset of the message -> block
+    with open(path, 'rb') as f:
+        def take(off):
+            f.seek(off)
+            window = f.read(config.sample_window)
+            framed = HLM1Framer(config).feed(window)
+            if framed:
+                blk = framed[0][1]
+                found.setdefault(off + window.find(blk), blk)
+        if mode == 'even':
+            for k in range(n):
+                take(size * k // n)
+        else:
+            for _ in range(SAMPLE_DRAWS * n):
+                if len(found) >= n:
+                    break
+                take(rng.randrange(size))
+    return [Frame(None, None, found[at]) for at in sorted(found)]
+
+def decode_blocks(blocks, config=DEFAULT_CONFIG):
+    # worker entry point: decode one flow (or one batch) of messages
+    return [process_message(b, config) for b in blocks]
+
+def decode_frames(frames, config=DEFAULT_CONFIG, cache=None, workers=1):
+    # returns the reversed tokens for every frame, in order.  Cache hits are resolved here;
+    # the rest is grouped per flow and decoded in parallel worker processes.
+    results = [None] * len(frames)
+    groups = {}
+    for idx, fr in enumerate(frames):
+        rev = cache.get(fr.block) if cache is not None else None
+        if rev is not None:
+            results[idx] = rev
+        else:
+            groups.setdefault(fr.flow, []).append(idx)
+    batches = []
+    for flow, idxs in groups.items():
+        step = len(idxs) if flow is not None else BATCH
+        batches.extend(idxs[k:k+step] for k in range(0, len(idxs), step))
+    work = [[frames[i].block for i in b] for b in batches]
+    if workers > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            decoded = list(pool.map(decode_blocks, work, [config] * len(work),
+                                    chunksize=max(1, len(work) // (workers * 4))))
+    else:
+        decoded = (decode_blocks(w, config) for w in work)
+    for idxs, revs in zip(batches, decoded):
+        for i, rev in zip(idxs, revs):
+            results[i] = rev
+            if cache is not None:
+                cache.put(frames[i].block, rev)
+    return results
+
+def decode(source, config=DEFAULT_CONFIG, lazy=False):
+    # yields a Message for every frame in `source`: a bytes-like object, a path to a binary
+    # capture or pcap/pcapng file, a binary file object, or an iterable of chunks.  Streams
+    # with bounded memory except for pcap input, whose flows are only complete at the end.
+    # lazy=True gives TokenView tokens, which is cheapest when only Message.text is used.
+    tokenize = process_message_lazy if lazy else process_message
+    if isinstance(source, (str, os.PathLike)) and is_capture(source):
+        frames, _stats = frame_capture(read_packets(source), config)
+    else:
+        frames = stream_frames(source, config)
+    for i, fr in enumerate(frames):
+        yield Message(i, fr, tokenize(fr.block, config), config)
@@ -0,0 +1,103 @@
+# PHI redaction for reassembled HL7 messages.
+#
+# Configured fields (e.g. PID-3, PID-5) are located by walking field separator
+# offsets inside the segments that carry them.  Reassembled messages often have
+# their segments run together ('...|2.5PID|1||...'), so a segment starts after a
+# line break or wherever a known segment ID is followed by the field separator,
+# as hl7_summary() in aggregate.py finds PID.  The message is then rebuilt
+# from the untouched slices between those spans plus the replacements, so
+# nothing else is split, re-parsed or re-serialized.  Values are either
+# masked, or replaced with a keyed blake2b token so the same patient maps to
+# the same token across messages and runs (as long as the key is the same).
+
+import re
+from hashlib import blake2b
+
+DEFAULT_FIELDS = ('PID-3', 'PID-5', 'PID-7', 'PID-11', 'PID-13', 'PID-14', 'PID-19', 'NK1-2', 'NK1-4', 'NK1-5')
+KEY_ENV = 'HLM1_REDACT_KEY'
+MASK_CHAR = '*'
+
+# segment IDs recognised without a preceding line break; the configured segments are added
+SEGMENT_IDS = ('MSH', 'EVN', 'PID', 'PD1', 'NK1', 'PV1', 'PV2', 'MRG', 'ORC', 'OBR', 'OBX', 'NTE',
+               'AL1', 'DG1', 'GT1', 'IN1')
+
+def parse_field_specs(specs):
+    # ['PID-3', 'NK1-2'] -> {'PID': {3}, 'NK1': {2}}
+    targets = {}
+    for spec in specs:
+        m = re.fullmatch(r'([A-Z0-9]{3})-(\d+)', spec.strip().upper())
+        if not m:
+            raise ValueError(f'bad field spec {spec!r} (expected e.g. PID-3)')
+        targets.setdefault(m.group(1), set()).add(int(m.group(2)))
+    return targets
+
+class Redactor:
+    def __init__(self, fields=DEFAULT_FIELDS, key=None, mode='token'):
+        if mode not in ('token', 'mask'):
+            raise ValueError(f'unknown redaction mode {mode!r}')
+        if mode == 'token' and not key:
+            raise ValueError('tokenizing needs a key so tokens stay consistent between runs')
+        self.targets = parse_field_specs(fields)
+        self.key = key.encode('utf-8') if isinstance(key, str) else key
+        self.mode = mode
+        self.fields_redacted = 0
+        self.unparsed = 0   # messages in which no configured segment was found
+        ids = sorted(set(SEGMENT_IDS) | set(self.targets), key=len, reverse=True)
+        self._ids = '|'.join(map(re.escape, ids))
+        self._cuts = {}     # field separator -> compiled segment boundary regex
+
+    def segments(self, text, fsep='|'):
+        # (start, end) of every segment: text between line breaks, also cut before each
+        # known segment ID directly followed by the field separator
+        cut = self._cuts.get(fsep)
+        if cut is None:
+            cut = self._cuts[fsep] = re.compile(r'[\r\n]+|(?=(?:%s)%s)' % (self._ids, re.escape(fsep)))
+        bounds = sorted({0, len(text)} | {p for m in cut.finditer(text) for p in m.span()})
+        return [(s, e) for s, e in zip(bounds, bounds[1:]) if text[s] not in '\r\n']
+
+    def replacement(self, value):
+        if self.mode == 'mask':
+            return MASK_CHAR * len(value)
+        digest = blake2b(value.encode('utf-8', 'surrogateescape'), key=self.key, digest_size=6).hexdigest()
+        return 'TKN' + digest.upper()
+
+    def spans(self, text):
+        # (start, end) of every configured field value, in order
+        msh = text.find('MSH')
+        fsep = text[msh + 3] if msh != -1 and len(text) > msh + 3 else '|'
+        targets = self.targets
+        out = []
+        found = False
+        for s, e in self.segments(text, fsep):
+            wanted = targets.get(text[s:s + 3])
+            if not wanted:
+                continue
+            found = True
+            last = max(wanted)
+            # MSH-1 is the separator itself, so MSH field numbers run one ahead of the separators
+            n = 1 if text[s:s + 3] == 'MSH' else 0
+            pos = text.find(fsep, s, e)
+            while pos != -1 and n < last:
+                n += 1
+                nxt = text.find(fsep, pos + 1, e)
+                end = e if nxt == -1 else nxt
+                if n in wanted and end > pos + 1:
+                    out.append((pos + 1, end))
+                pos = nxt
+        if not found:
+            self.unparsed += 1
+        return out
+
+    def redact(self, text):
+        spans = self.spans(text)
+        if not spans:
+            return text
+        pieces = []
+        prev = 0
+        for s, e in spans:
+            pieces.append(text[prev:s])
+            pieces.append(self.replacement(text[s:e]))
+            prev = e
+        pieces.append(text[prev:])
+        self.fields_redacted += len(spans)
+        return ''.join(pieces)
@@ -0,0 +1,65 @@
+# Output sinks.  A sink receives every Message through write() and is closed
+# once at the end; use them as context managers.  Subclass Sink (or wrap a
+# function in CallbackSink) to send messages somewhere other than a file.
+
+from .tokens import make_pretty
+
+class Sink:
+    def write(self, msg):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TextSink(Sink):
+    # base for sinks writing labelled sections to a text file; path or open text stream
+    def __init__(self, out):
+        self.own = not hasattr(out, 'write')
+        self.out = open(out, 'w', encoding='utf-8', errors='replace') if self.own else out
+
+    def close(self):
+        if self.own:
+            self.out.close()
+
+class TokenDumpSink(TextSink):
+    # reversed tokens, one per line
+    def write(self, msg):
+        self.out.write(msg.label() + '\n')
+        for j, t in enumerate(msg.tokens):
+            self.out.write(f'[{j:03d}] {t}\n')
+        self.out.write('\n\n')
+
+class ReassembledSink(TextSink):
+    def write(self, msg):
+        self.out.write(msg.label() + '\n')
+        self.out.write(msg.text + '\n\n')
+
+class PrettySink(TextSink):
+    # make a 'pretty' attempt for quick inspection
+    def write(self, msg):
+        self.out.write(msg.label() + '\n')
+        self.out.write(make_pretty(msg.text) + '\n\n')
+
+class AggregateSink(Sink):
+    # feeds a WindowAggregator (see aggregate.py) with the reassembled text
+    def __init__(self, agg):
+        self.agg = agg
+
+    def write(self, msg):
+        self.agg.add(msg.text, msg.ts)
+
+    def close(self):
+        self.agg.close()
+
+class CallbackSink(Sink):
+    def __init__(self, fn):
+        self.fn = fn
+
+    def write(self, msg):
+        self.fn(msg)
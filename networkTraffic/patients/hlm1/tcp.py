@@ -0,0 +1,126 @@
+# TCP reassembly for HLM1-over-TCP captures.
+#
+# Each direction of a connection is a TCPStream: segment payloads are copied
+# into a fixed-size ring buffer at their offset from the next expected
+# sequence number, a parallel byte map marks which ring slots are filled, and
+# whatever is contiguous from the head is released in order.  Retransmissions
+# and overlaps just rewrite the same slots, out-of-order data waits in the
+# ring until the hole before it is filled, and anything beyond the ring (the
+# "window") is dropped and counted.  No per-segment objects are kept.
+
+from .pcap import TCP_FIN, TCP_SYN, TCP_RST
+
+SEQ_MOD = 1 << 32
+DEFAULT_CAPACITY = 1 << 18
+
+def seq_diff(a, b):
+    # signed distance a - b in 32-bit sequence space
+    return (a - b + (1 << 31)) % SEQ_MOD - (1 << 31)
+
+class TCPStream:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.ring = None             # allocated on first payload
+        self.have = None
+        self.head = 0                # ring index of next_seq
+        self.next_seq = None         # sequence number of the next byte to deliver
+        self.fin_seq = None
+        self.closed = False
+        self.delivered = 0
+        self.overlap = 0             # bytes received again after delivery (retransmits)
+        self.dropped = 0             # bytes beyond the window or after close
+
+    def _reset(self):
+        self.head = 0
+        self.next_seq = None
+        self.fin_seq = None
+        self.closed = False
+        if self.have is not None:
+            self.have[:] = bytes(self.capacity)
+
+    def segment(self, seq, flags, payload):
+        # feed one segment; returns the bytes that became deliverable in order (may be b'')
+        if flags & TCP_SYN:
+            if self.closed or self.next_seq is None or self.delivered == 0:
+                if self.closed:
+                    self._reset()  # port reuse: a new connection on the same 5-tuple
+                self.next_seq = (seq + 1) % SEQ_MOD
+            seq = (seq + 1) % SEQ_MOD
+        if self.closed:
+            self.dropped += len(payload)
+            return b''
+        if self.next_seq is None:
+            self.next_seq = seq  # capture started mid-connection
+        if flags & TCP_FIN:
+            self.fin_seq = (seq + len(payload)) % SEQ_MOD
+        if payload:
+            self._store(seq, payload)
+        out = self._release()
+        if flags & TCP_RST or (self.fin_seq is not None and self.next_seq == self.fin_seq):
+            self.close()
+        return out
+
+    def _store(self, seq, payload):
+        rel = seq_diff(seq, self.next_seq)
+        n = len(payload)
+        mv = memoryview(payload)
+        if rel < 0:
+            # leading part already delivered
+            skip = min(-rel, n)
+            self.overlap += skip
+            mv = mv[skip:]
+            n -= skip
+            rel = 0
+        if rel + n > self.capacity:
+            keep = max(0, self.capacity - rel)
+            self.dropped += n - keep
+            mv = mv[:keep]
+            n = keep
+        if n <= 0:
+            return
+        if self.ring is None:
+            self.ring = bytearray(self.capacity)
+            self.have = bytearray(self.capacity)
+        start = (self.head + rel) % self.capacity
+        first = min(n, self.capacity - start)
+        self.ring[start:start + first] = mv[:first]
+        self.have[start:start + first] = b'\x01' * first
+        if first < n:
+            self.ring[:n - first] = mv[first:]
+            self.have[:n - first] = b'\x01' * (n - first)
+
+    def _release(self):
+        if self.have is None:
+            return b''
+        cap, head, have = self.capacity, self.head, self.have
+        end = have.find(0, head)
+        if end == -1:
+            # filled through the end of the ring; continue from the start
+            wrap = have.find(0, 0, head)
+            n = cap - head + (head if wrap == -1 else wrap)
+        else:
+            n = end - head
+        if n == 0:
+            return b''
+        if head + n <= cap:
+            out = bytes(self.ring[head:head + n])
+            have[head:head + n] = bytes(n)
+        else:
+            tail = head + n - cap
+            out = bytes(self.ring[head:]) + bytes(self.ring[:tail])
+            have[head:] = bytes(cap - head)
+            have[:tail] = bytes(tail)
+        self.head = (head + n) % cap
+        self.next_seq = (self.next_seq + n) % SEQ_MOD
+        self.delivered += n
+        return out
+
+    def close(self):
+        # anything still waiting behind a hole is lost
+        if self.have is not None:
+            self.dropped += self.have.count(1)
+            self.have[:] = bytes(self.capacity)
+        self.closed = True
+
+    def stats(self):
+        return {'delivered': self.delivered, 'overlap': self.overlap, 'dropped': self.dropped}
@@ -0,0 +1,119 @@
+# Turning one framed message into text: split the payload on SEP, reverse
+# each token, trim non-printable edges and join.
+
+from array import array
+from collections.abc import Sequence
+
+from .config import DEFAULT_CONFIG
+
+def is_printable_char(c):
+    # keep common whitespace + printable ascii
+    return 32 <= c < 127 or c in (9,10,13)
+
+def clean_printable(s):
+    # remove leading/trailing non-printable chars (but keep inner whitespace)
+    # s is a str (already decoded with latin-1)
+    # trim edges that are mostly nonprintable
+    start = 0
+    end = len(s)
+    while start < end and not any(ord(ch) == ord(ch) and is_printable_char(ord(ch)) for ch in s[start:start+1]):
+        start += 1
+    while end > start and not any(is_printable_char(ord(ch)) for ch in s[end-1:end]):
+        end -= 1
+    return s[start:end]
+
+def process_message(block, config=DEFAULT_CONFIG):
+    # block includes the leading MAGIC and any bytes after it
+    # skip the MAGIC itself for token processing (but you can keep it if desired)
+    payload = block[len(config.magic):]
+    # split on SEP
+    tokens = payload.split(config.sep)
+    rev_tokens = []
+    for t in tokens:
+        if not t:
+            rev_tokens.append('')  # preserve empties
+            continue
+        try:
+            s = t.decode('latin-1', errors='replace')
+        except Exception:
+            s = ''.join(chr(b) for b in t)
+        # reverse characters
+        r = s[::-1]
+        if config.strip_nonprint:
+            r = clean_printable(r)
+        rev_tokens.append(r)
+    return rev_tokens
+
+# bytes clean_printable() would trim, for trimming tokens before they are decoded
+NONPRINT = bytes(c for c in range(256) if not is_printable_char(c))
+
+class TokenView(Sequence):
+    # lazy process_message(): keeps the message buffer and an array of token start offsets,
+    # and decodes / reverses / cleans a token only when it is accessed
+    __slots__ = ('payload', 'starts', 'config')
+
+    def __init__(self, block, config=DEFAULT_CONFIG):
+        sep = config.sep
+        payload = block[len(config.magic):]
+        starts = array('l', [0])
+        pos = payload.find(sep)
+        while pos != -1:
+            starts.append(pos + len(sep))
+            pos = payload.find(sep, pos + len(sep))
+        starts.append(len(payload) + len(sep))  # sentinel: one past the last token
+        self.payload = payload
+        self.starts = starts
+        self.config = config
+
+    def __len__(self):
+        return len(self.starts) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('token index out of range')
+        r = self.payload[self.starts[i]:self.starts[i+1] - len(self.config.sep)][::-1]
+        if self.config.strip_nonprint:
+            r = r.strip(NONPRINT)
+        return r.decode('latin-1')
+
+    def join(self, joiner=None):
+        # same as joiner.join(process_message(block)) without building any per-token strings when
+        # possible: reversing the whole payload reverses every token in one slice (tokens come out
+        # last-to-first), so only the token order has to be flipped back
+        config = self.config
+        joiner = config.joiner if joiner is None else joiner
+        if len(config.sep) != 1:
+            return joiner.join(self)
+        parts = self.payload[::-1].split(config.sep)
+        parts.reverse()
+        if config.strip_nonprint:
+            parts = [t.strip(NONPRINT) for t in parts]
+        try:
+            return joiner.encode('latin-1').join(parts).decode('latin-1')
+        except UnicodeEncodeError:
+            return joiner.join(t.decode('latin-1') for t in parts)
+
+def process_message_lazy(block, config=DEFAULT_CONFIG):
+    return TokenView(block, config)
+
+def assemble(rev, config=DEFAULT_CONFIG):
+    # reassemble by concatenating reversed tokens (config.joiner controls spacing)
+    return (rev.join() if isinstance(rev, TokenView) else config.joiner.join(rev)).strip()
+
+def make_pretty(text):
+    # small heuristics to make the text more HL7-like / readable:
+    # - replace repeated control sequences that look like encoding markers
+    # - insert newlines on common HL7 segment IDs like MSH, PID, OBR, OBX, PV1, etc. (case-insensitive)
+    segs = ['MSH','PID','NK1','PV1','OBR','OBX','AL1','GT1','DG1','Z']  # Z* are custom segments
+    out = text
+    # insert newline before known segment markers if they're immediate content
+    for seg in segs:
+        out = out.replace(seg, '\n'+seg)
+        out = out.replace(seg.lower(), '\n'+seg.lower())
+    # collapse multiple newlines
+    out = '\n'.join([line.strip() for line in out.splitlines() if line.strip()!=''])
+    return out
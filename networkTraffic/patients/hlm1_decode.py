@@ -1,129 +1,207 @@
 #!/usr/bin/env python3
 
-import os, sys, argparse
+import os, argparse, contextlib, random
+from operator import attrgetter
 from pathlib import Path
 
+from hlm1 import (DecoderConfig, HLM1Framer, Message, decode_frames, frame_capture, iter_capture,
+                  process_message_lazy, reservoir_sample, sample_seek, stream_frames)
+from hlm1 import decode_messages as _decode_messages, process_message as _process_message
+from hlm1.aggregate import WindowAggregator, window_slices
+from hlm1.cache import DecodeCache, DEFAULT_MAX_BYTES
+from hlm1.dedup import Deduplicator, DEFAULT_WINDOW
+from hlm1.pcap import is_capture, merge_packets, read_packets
+from hlm1.redact import DEFAULT_FIELDS, KEY_ENV, Redactor
+from hlm1.sinks import AggregateSink, PrettySink, ReassembledSink, TokenDumpSink
+
+# command line defaults; the library takes these through hlm1.DecoderConfig
 SEP = b'\xaa'         # observed separator between chunks
 MAGIC = b'HLM1'        # observed message header
 JOINER = ''            # how to join reversed tokens when producing reassembled text
 STRIP_NONPRINT = True  # attempt to remove stray non-printable characters from token ends for readability
 
-def is_printable_char(c):
-    # keep common whitespace + printable ascii
-    return 32 <= c < 127 or c in (9,10,13)
-
-def clean_printable(s):
-    # remove leading/trailing non-printable chars (but keep inner whitespace)
-    # s is a str (already decoded with latin-1)
-    # trim edges that are mostly nonprintable
-    start = 0
-    end = len(s)
-    while start < end and not any(ord(ch) == ord(ch) and is_printable_char(ord(ch)) for ch in s[start:start+1]):
-        start += 1
-    while end > start and not any(is_printable_char(ord(ch)) for ch in s[end-1:end]):
-        end -= 1
-    return s[start:end]
+def script_config():
+    return DecoderConfig(sep=SEP, magic=MAGIC, joiner=JOINER, strip_nonprint=STRIP_NONPRINT)
 
+# kept for callers of the old script functions
 def decode_messages(data):
-    msgs = []
-    idx = 0
-    while True:
-        pos = data.find(MAGIC, idx)
-        if pos == -1:
-            break
-        # find next magic to bound this message
-        next_pos = data.find(MAGIC, pos+len(MAGIC))
-        if next_pos == -1:
-            block = data[pos:]
-            idx = len(data)
-        else:
-            block = data[pos:next_pos]
-            idx = next_pos
-        msgs.append(block)
-    return msgs
+    return _decode_messages(data, script_config())
 
 def process_message(block):
-    # block includes the leading 'HLM1' and any bytes after it
-    # skip the MAGIC itself for token processing (but you can keep it if desired)
-    payload = block[len(MAGIC):]
-    # split on SEP
-    tokens = payload.split(SEP)
-    rev_tokens = []
-    for t in tokens:
-        if not t:
-            rev_tokens.append('')  # preserve empties
-            continue
-        try:
-            s = t.decode('latin-1', errors='replace')
-        except Exception:
-            s = ''.join(chr(b) for b in t)
-        # reverse characters
-        r = s[::-1]
-        if STRIP_NONPRINT:
-            r = clean_printable(r)
-        rev_tokens.append(r)
-    return rev_tokens
-
-def make_pretty(text):
-    # small heuristics to make the text more HL7-like / readable:
-    # - replace repeated control sequences that look like encoding markers
-    # - insert newlines on common HL7 segment IDs like MSH, PID, OBR, OBX, PV1, etc. (case-insensitive)
-    segs = ['MSH','PID','NK1','PV1','OBR','OBX','AL1','GT1','DG1','Z']  # Z* are custom segments
-    out = text
-    # insert newline before known segment markers if they're immediate content
-    for seg in segs:
-        out = out.replace(seg, '\n'+seg)
-        out = out.replace(seg.lower(), '\n'+seg.lower())
-    # collapse multiple newlines
-    out = '\n'.join([line.strip() for line in out.splitlines() if line.strip()!=''])
-    return out
+    return _process_message(block, script_config())
 
 def main():
     p = argparse.ArgumentParser(description='Decode HLM1-style messages from a binary capture.')
-    p.add_argument('infile', help='input binary file (e.g. udp_combined.bin)')
+    p.add_argument('infile', nargs='+',
+                   help='input binary file (e.g. udp_combined.bin) or pcap/pcapng capture (e.g. patients.pcap); '
+                        'several captures (one per tap) are merged on packet timestamps')
     p.add_argument('outdir', help='output directory to write results')
+    p.add_argument('--cache', metavar='DIR', help='reuse decoded messages from (and store them in) an on-disk cache')
+    p.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024), metavar='MB',
+                   help='evict least recently used cache entries beyond this size (default: %(default)s)')
+    p.add_argument('--dedup', action='store_true', help='drop retransmitted copies of messages before decoding')
+    p.add_argument('--dedup-window', type=int, default=DEFAULT_WINDOW, metavar='N',
+                   help='number of recent messages remembered for --dedup (default: %(default)s)')
+    p.add_argument('--dedup-bloom', action='store_true',
+                   help='use rotating Bloom filters instead of an exact LRU window (for very large windows)')
+    p.add_argument('--dedup-seconds', type=float, metavar='S',
+                   help='with pcap input, only treat copies seen within S seconds as duplicates')
+    p.add_argument('--workers', type=int, metavar='N',
+                   help='worker processes used to decode flows in parallel (default: one per CPU)')
+    p.add_argument('--sample', type=int, metavar='N', help='decode only N sampled messages (quick look at huge captures)')
+    p.add_argument('--sample-mode', choices=('even', 'random', 'reservoir'), default='even',
+                   help='even/random seek into a binary capture; reservoir draws a uniform sample in one '
+                        'streaming pass, and is what pcap input always uses (default: %(default)s)')
+    p.add_argument('--seed', type=int, help='random seed for --sample-mode random/reservoir')
+    p.add_argument('--aggregate', type=float, metavar='SECONDS',
+                   help='write per-window counts by message type, facility and patient to aggregates.jsonl')
+    p.add_argument('--slide', type=float, metavar='SECONDS',
+                   help='emit a sliding window every SECONDS instead of tumbling windows')
+    p.add_argument('--distinct-patients', action='store_true',
+                   help='add a HyperLogLog estimate of distinct patients to each window')
+    p.add_argument('--no-tokens', action='store_true',
+                   help='skip the per-token dump; messages are then reassembled lazily without per-token strings')
+    p.add_argument('--redact', action='store_true',
+                   help='mask or tokenize patient identifiers before anything is written (token dumps are skipped)')
+    p.add_argument('--redact-fields', default=','.join(DEFAULT_FIELDS), metavar='SEG-N,...',
+                   help='HL7 fields to redact (default: %(default)s)')
+    p.add_argument('--redact-mode', choices=('token', 'mask'), default='token',
+                   help='token: keyed hash, consistent across messages; mask: overwrite with * (default: %(default)s)')
+    p.add_argument('--redact-key', default=os.environ.get(KEY_ENV),
+                   help=f'key for --redact-mode token (default: ${KEY_ENV})')
     args = p.parse_args()
+    config = script_config()
+
+    redactor = None
+    if args.redact:
+        try:
+            redactor = Redactor(args.redact_fields.split(','), args.redact_key, args.redact_mode)
+        except ValueError as e:
+            p.error(str(e))
+    if args.aggregate:
+        try:
+            window_slices(args.aggregate, args.slide)
+        except ValueError as e:
+            p.error(f'--aggregate/--slide: {e}')
 
-    infile = Path(args.infile)
+    infiles = [Path(f) for f in args.infile]
+    infile = infiles[0]
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    data = infile.read_bytes()
-    msgs = decode_messages(data)
-    if not msgs:
+    if len(infiles) > 1 and not all(is_capture(f) for f in infiles):
+        p.error('only pcap/pcapng captures can be merged')
+    if is_capture(infile):
+        if len(infiles) > 1:
+            # taps see the same packets: TCP copies collapse in reassembly, UDP copies need --dedup
+            print(f'Merging {len(infiles)} captures on packet timestamps')
+            packets = merge_packets(infiles)
+        else:
+            packets = read_packets(infile)
+        if args.sample:
+            # packet records cannot be seeked into, so captures are always sampled from the framed
+            # stream; frames go straight into the reservoir, so memory stays at N plus open flows
+            stats = {}
+            frames = reservoir_sample(iter_capture(packets, config, stats), args.sample, random.Random(args.seed))
+            frames.sort(key=attrgetter('ts'))
+            print(f'Sampled {len(frames)} of {stats["frames"]} messages in {stats["flows"]} flows')
+        else:
+            frames, stats = frame_capture(packets, config)
+            print(f'{len(frames)} messages in {stats["flows"]} flows')
+        if stats['tcp_streams']:
+            print(f'TCP: {stats["tcp_streams"]} streams, {stats["delivered"]} bytes in order, '
+                  f'{stats["overlap"]} retransmitted, {stats["dropped"]} dropped')
+    elif args.sample and args.sample_mode != 'reservoir':
+        frames = sample_seek(infile, args.sample, args.sample_mode, random.Random(args.seed), config)
+        stats = {'bad': 0, 'skipped': 0}
+        print(f'Sampled {len(frames)} messages from {infile.stat().st_size} bytes')
+    else:
+        framer = HLM1Framer(config)
+        framed = stream_frames(infile, config, framer)
+        if args.sample:
+            frames = reservoir_sample(framed, args.sample, random.Random(args.seed))
+        else:
+            frames = list(framed)
+        stats = framer.stats()
+    if stats['bad'] or stats['skipped']:
+        print(f'Framing: {stats["bad"]} corrupt frames rejected, {stats["skipped"]} bytes skipped while resynchronizing')
+    if not frames:
         print('No messages starting with', MAGIC, 'found in', infile)
         return
 
+    # drop retransmissions right after framing so nothing downstream sees them;
+    # message numbers keep referring to the position in the framed stream
+    dedup = None
+    numbered = list(enumerate(frames))
+    if args.dedup:
+        dedup = Deduplicator(args.dedup_window, seconds=args.dedup_seconds, bloom=args.dedup_bloom)
+        numbered = [(i, fr) for i, fr in numbered if not dedup.is_duplicate(fr.block, fr.ts)]
+
     # write per-message reversed tokens and reassembled variants
     rev_tokens_path = outdir / 'messages_reversed_tokens.txt'
     reassembled_path = outdir / 'messages_reassembled.txt'
     pretty_path = outdir / 'messages_pretty.txt'
 
-    with rev_tokens_path.open('w', encoding='utf-8', errors='replace') as f_tok, \
-         reassembled_path.open('w', encoding='utf-8', errors='replace') as f_re, \
-         pretty_path.open('w', encoding='utf-8', errors='replace') as f_pre:
-        for i,blk in enumerate(msgs):
-            rev = process_message(blk)
-            # write tokens (one per line) with header info
-            f_tok.write(f'-- MESSAGE {i} --\n')
-            for j,t in enumerate(rev):
-                f_tok.write(f'[{j:03d}] {t}\n')
-            f_tok.write('\n\n')
-
-            # reassemble by concatenating reversed tokens (JOINER controls spacing)
-            assembled = JOINER.join(rev).strip()
-            f_re.write(f'-- MESSAGE {i} --\n')
-            f_re.write(assembled + '\n\n')
-
-            # make a 'pretty' attempt for quick inspection
-            pretty = make_pretty(assembled)
-            f_pre.write(f'-- MESSAGE {i} --\n')
-            f_pre.write(pretty + '\n\n')
+    with contextlib.ExitStack() as stack:
+        # the cache is committed and closed however decoding ends, so finished work is never lost
+        cache = None
+        if args.cache:
+            cache = stack.enter_context(
+                DecodeCache(args.cache, config.cache_settings(), max_bytes=args.cache_size * 1024 * 1024))
+        write_tokens = redactor is None and not args.no_tokens
+        if write_tokens or cache is not None or args.workers is not None:
+            # the cache and the worker pool both deal in full token lists, so asking for either
+            # takes the regular path even when only the joined text is written
+            workers = args.workers or os.cpu_count() or 1
+            decoded = decode_frames([fr for _i, fr in numbered], config, cache, workers)
+        else:
+            # only the joined text is needed, which TokenView.join() produces cheaply in-process
+            decoded = [process_message_lazy(fr.block, config) for _i, fr in numbered]
+
+        sinks = []
+        if redactor is not None:
+            # tokens do not line up with HL7 fields, so they cannot be redacted; never leave an old dump behind
+            rev_tokens_path.unlink(missing_ok=True)
+        elif write_tokens:
+            sinks.append(TokenDumpSink(rev_tokens_path))
+        sinks += [ReassembledSink(reassembled_path), PrettySink(pretty_path)]
+        aggregates_path = outdir / 'aggregates.jsonl'
+        agg = None
+        if args.aggregate:
+            agg = WindowAggregator(aggregates_path.open('w', encoding='utf-8'), args.aggregate, args.slide,
+                                   distinct=args.distinct_patients)
+            sinks.append(AggregateSink(agg))
+
+        for sink in sinks:
+            stack.enter_context(sink)
+        for (i,fr),rev in zip(numbered, decoded):
+            msg = Message(i, fr, rev, config)
+            if redactor is not None:
+                msg.text = redactor.redact(msg.text)
+            for sink in sinks:
+                sink.write(msg)
+
+    if agg is not None:
+        agg.out.close()
+        undated = f', {agg.undated.messages} undated counted apart' if agg.undated.messages else ''
+        print(f'Aggregates: {agg.emitted} {agg.kind} windows ({agg.late} late messages dropped{undated})')
+    if redactor is not None:
+        print(f'Redaction: {redactor.fields_redacted} fields {"tokenized" if redactor.mode == "token" else "masked"}')
+        if redactor.unparsed:
+            print(f'Warning: {redactor.unparsed} messages had none of the segments to redact '
+                  f'({", ".join(sorted(redactor.targets))}); check them before sharing the output')
+    if dedup is not None:
+        print('Dedup:', dedup.report())
+    if cache is not None:
+        print(f'Cache: {cache.hits} hits, {cache.misses} misses ({cache.path})')
 
     print('Wrote:')
-    print(' -', rev_tokens_path)
+    if write_tokens:
+        print(' -', rev_tokens_path)
     print(' -', reassembled_path)
     print(' -', pretty_path)
+    if agg is not None:
+        print(' -', aggregates_path)
     print('\nOpen the *_pretty.txt in your editor to inspect, or the *_tokens.txt to see token-by-token reversals.')
     print('If you want different behavior (keep 0xaa markers, use a different separator, or insert length prefixes), edit SEP / JOINER variables at the top of the script.')
 
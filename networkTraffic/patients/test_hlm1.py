@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# Run with: python3 -m pytest test_hlm1.py
+
+import io, json, random
+from pathlib import Path
+
+import pytest
+
+from hlm1 import Message, decode_messages, frame_capture, process_message_lazy, sample_seek
+from hlm1.aggregate import WindowAggregator, window_slices
+from hlm1.dedup import Deduplicator
+from hlm1.pcap import FlowKey, Packet
+from hlm1.redact import Redactor
+
+CAPTURE = Path(__file__).with_name('udp_combined.bin')
+
+def two_flow_capture(count=12):
+    # `count` real frames sent one per packet, alternating between two UDP flows, one second apart
+    blocks = decode_messages(CAPTURE.read_bytes())[:count]
+    flows = [FlowKey(17, '10.0.0.1', 4000, '10.0.0.9', 5000), FlowKey(17, '10.0.0.2', 4001, '10.0.0.9', 5000)]
+    return [Packet(1000.0 + i, flows[i % 2], blk, 0, 0) for i, blk in enumerate(blocks)]
+
+def test_capture_frames_are_time_ordered():
+    frames, stats = frame_capture(two_flow_capture())
+    assert stats['flows'] == 2 and len(frames) == 12
+    assert [fr.ts for fr in frames] == sorted(fr.ts for fr in frames)
+
+def test_multi_flow_aggregation_drops_nothing():
+    frames, _stats = frame_capture(two_flow_capture())
+    out = io.StringIO()
+    agg = WindowAggregator(out, window=4, slide=2)
+    for i, fr in enumerate(frames):
+        msg = Message(i, fr, process_message_lazy(fr.block))
+        agg.add(msg.text, msg.ts)
+    agg.close()
+    assert agg.late == 0
+    windows = [json.loads(line) for line in out.getvalue().splitlines()]
+    # every message lands in two overlapping sliding windows
+    assert sum(w['messages'] for w in windows) == 2 * 12
+
+def test_window_slide_float_multiples():
+    assert window_slices(1, 0.1) == 10
+    assert window_slices(0.3, 0.1) == 3
+    assert window_slices(60) == 1
+    with pytest.raises(ValueError):
+        window_slices(1, 0.3)
+    with pytest.raises(ValueError):
+        window_slices(1, 2)
+
+def test_bloom_dedup_honours_seconds():
+    dedup = Deduplicator(1000, seconds=10, bloom=True)
+    assert not dedup.is_duplicate(b'msg', 0.0)
+    assert dedup.is_duplicate(b'msg', 5.0)
+    assert not dedup.is_duplicate(b'other', 20.0)
+    assert not dedup.is_duplicate(b'msg', 40.0)   # more than 3 windows later: a new message
+
+def test_random_seek_sample_finds_n_distinct_messages():
+    for seed in range(20):
+        frames = sample_seek(CAPTURE, 10, 'random', random.Random(seed))
+        assert len(frames) == 10 and len({fr.block for fr in frames}) == 10
+    # asking for more messages than the capture holds stops once the draws run out
+    assert len(sample_seek(CAPTURE, 100, 'random', random.Random(1))) <= len(decode_messages(CAPTURE.read_bytes()))
+
+def hl7(sent, patient='12345'):
+    return f'MSH|^~\\&|APP|FAC|||{sent}||ADT^A01|1|P|2.5\rPID|1||{patient}^^^H||DOE^JOHN'
+
+def test_undated_message_does_not_make_later_ones_late():
+    out = io.StringIO()
+    agg = WindowAggregator(out, window=60)
+    for sent in ('20240101120000', '20240101120010', '', '20240101120020', '20240101120100', '20240101120110'):
+        agg.add(hl7(sent))
+    agg.close()
+    assert agg.late == 0 and agg.undated.messages == 0
+    assert sum(json.loads(line)['messages'] for line in out.getvalue().splitlines()) == 6
+
+def test_undated_messages_before_any_timestamp_are_counted_apart():
+    out = io.StringIO()
+    agg = WindowAggregator(out, window=60)
+    agg.add(hl7(''))
+    agg.add(hl7('20240101120000'))
+    agg.close()
+    assert agg.late == 0
+    windows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(w['window'], w['messages']) for w in windows] == [('tumbling', 1), ('undated', 1)]
+
+def test_redaction_finds_concatenated_segments():
+    text = hl7('20240101120000').replace('\r', '') + 'NK1|1|DOE^JANE|SPO'
+    redactor = Redactor(mode='mask')
+    out = redactor.redact(text)
+    assert '12345' not in out and 'DOE' not in out
+    assert out.startswith('MSH|^~\\&|APP|FAC|||20240101120000||ADT^A01|1|P|2.5PID|1||*********||')
+    assert redactor.fields_redacted == 3 and redactor.unparsed == 0
+    redactor.redact('no segments here')
+    assert redactor.unparsed == 1